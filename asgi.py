@@ -0,0 +1,26 @@
+import time
+
+from a2wsgi import WSGIMiddleware
+from backend.app import create_app
+
+def stamp_arrival(asgi_app):
+    """
+    Set X-Request-Start when the event loop receives a request, replacing any
+    value the client sent, so the concurrency limiter counts the time the
+    request then waits for a thread.
+    """
+    async def app(scope, receive, send):
+        if scope['type'] == 'http':
+            headers = [(name, value) for name, value in scope['headers'] if name != b'x-request-start']
+            headers.append((b'x-request-start', f't={time.time():.6f}'.encode()))
+            scope = dict(scope, headers=headers)
+        await asgi_app(scope, receive, send)
+    return app
+
+# X-Request-Start always comes from stamp_arrival below, so it can be trusted
+flask_app = create_app(config_overrides={'CONCURRENCY_TRUST_REQUEST_START': True})
+
+# The event loop owns the client connections, so slow or idle clients no longer
+# pin a worker; requests are handed to a thread pool once fully received and
+# served by the same sync routes as the gunicorn deployment
+app = stamp_arrival(WSGIMiddleware(flask_app, workers=flask_app.config['WORKER_THREADS']))
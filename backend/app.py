@@ -1,59 +1,73 @@
 import os
-import logging
 from flask import Flask, jsonify
 from flask_cors import CORS
-from flask_jwt_extended import JWTManager
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from .config import get_config
 from .models.user import db
-from .routes import auth_bp, tasks_bp, projects_bp
+from .schema import check_schema
+from .job_queue import JobRunner
+from .routes.batch import BatchJWTManager
+from .routes import auth_bp, tasks_bp, projects_bp, dashboard_bp, batch_bp, jobs_bp, frontend_bp
+from .utils.compression import init_compression
+from .utils.log import configure_logging
+from .utils.concurrency import init_load_shedding
 
-def create_app(config_name=None):
+def create_app(config_name=None, config_overrides=None):
     app = Flask(__name__)
     
     # Load configuration
-    app.config.from_object(get_config())
+    app.config.from_object(get_config(config_name))
+    if config_overrides:
+        app.config.update(config_overrides)
     
     # Initialize extensions
     db.init_app(app)
-    jwt = JWTManager(app)
+    jwt = BatchJWTManager(app)
     CORS(app)
+    init_compression(app)
+    
+    # Shed excess load before any other request processing
+    if app.config['CONCURRENCY_LIMIT_ENABLED']:
+        init_load_shedding(app)
     
     # Configure rate limiting
-    limiter = Limiter(
-        app,
-        key_func=get_remote_address,
-        default_limits=["100 per minute"],
-        storage_uri=app.config['RATELIMIT_STORAGE_URL']
-    )
+    # Flask-Limiter is only imported when enabled, it is one of the slowest imports at boot
+    if app.config['RATELIMIT_ENABLED']:
+        from flask_limiter import Limiter
+        from flask_limiter.util import get_remote_address
+        
+        limiter = Limiter(
+            app,
+            key_func=get_remote_address,
+            default_limits=["100 per minute"],
+            storage_uri=app.config['RATELIMIT_STORAGE_URL']
+        )
     
     # Configure logging
-    if not app.debug:
-        handler = logging.StreamHandler()
-        handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        app.logger.addHandler(handler)
-        app.logger.setLevel(logging.INFO)
-    else:
-        # Even in debug mode, we want to see INFO logs
-        app.logger.setLevel(logging.INFO)
+    # Records are queued and written as JSON by a background thread, so log I/O
+    # never blocks a request
+    configure_logging(app)
     
     # Register blueprints
     app.register_blueprint(auth_bp)
     app.register_blueprint(tasks_bp)
     app.register_blueprint(projects_bp)
+    app.register_blueprint(dashboard_bp)
+    app.register_blueprint(batch_bp)
+    app.register_blueprint(jobs_bp)
     
-    # Create database tables
+    # Check the database schema is current. Tables are created by `python migrate.py`,
+    # or here when AUTO_MIGRATE is set
     with app.app_context():
-        try:
-            db.create_all()
-            app.logger.info("Database tables created successfully")
-        except Exception as e:
-            app.logger.error(f"Error creating database tables: {str(e)}")
-            # This is critical, so we should re-raise the exception
-            raise
+        check_schema(app)
+        # Workers forked from a preloading gunicorn master must not share its connections
+        db.engine.dispose()
+    
+    # Background jobs run in a process pool started on the first request, so
+    # it is created in each gunicorn worker rather than in a preloading master
+    if app.config['JOBS_ENABLED']:
+        job_runner = JobRunner(app)
+        app.extensions['job_runner'] = job_runner
+        app.before_first_request(job_runner.start)
     
     # Error handlers
     @app.errorhandler(404)
@@ -96,13 +110,16 @@ def create_app(config_name=None):
             'error': 'authorization_required'
         }), 401
     
-    # Root route
-    @app.route('/')
-    def index():
-        return jsonify({
-            'success': True,
-            'message': 'Task Management API',
-            'version': '1.0.0'
-        })
+    # Serve the built frontend if present, otherwise the API index at the root
+    if os.path.isfile(os.path.join(app.config['FRONTEND_DIST'], 'index.html')):
+        app.register_blueprint(frontend_bp)
+    else:
+        @app.route('/')
+        def index():
+            return jsonify({
+                'success': True,
+                'message': 'Task Management API',
+                'version': '1.0.0'
+            })
     
     return app
\ No newline at end of file
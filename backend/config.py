@@ -17,23 +17,85 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', f'sqlite:///{DB_PATH}')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Create or upgrade the schema at boot instead of requiring `python migrate.py`
+    AUTO_MIGRATE = os.environ.get('AUTO_MIGRATE', '0') == '1'
+    
     # JWT configuration
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'jwt_dev_key_for_development_only')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
     
+    # Threads serving requests in each worker process, read by gunicorn.conf.py and asgi.py
+    WORKER_THREADS = int(os.environ.get('WORKER_THREADS', 8))
+    
+    # Adaptive concurrency limiting per process. The limit moves between
+    # CONCURRENCY_MIN_LIMIT and WORKER_THREADS to keep latency, measured from
+    # the request's arrival, near CONCURRENCY_TARGET_LATENCY seconds. Requests
+    # over the limit, or reads and bulk requests that waited more than their
+    # share of CONCURRENCY_MAX_QUEUE_DELAY seconds for a thread, get a 503.
+    # Arrival is taken from X-Request-Start only with
+    # CONCURRENCY_TRUST_REQUEST_START, set when a front-end proxy overwrites
+    # the header, since clients can send any value
+    CONCURRENCY_LIMIT_ENABLED = os.environ.get('CONCURRENCY_LIMIT_ENABLED', '1') == '1'
+    CONCURRENCY_TRUST_REQUEST_START = os.environ.get('CONCURRENCY_TRUST_REQUEST_START', '0') == '1'
+    CONCURRENCY_MIN_LIMIT = 2
+    CONCURRENCY_TARGET_LATENCY = 0.25
+    CONCURRENCY_MAX_QUEUE_DELAY = 0.5
+    CONCURRENCY_RETRY_AFTER = 1
+    
     # Rate limiting
+    RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', '1') == '1'
     RATELIMIT_DEFAULT = "100 per minute"
     RATELIMIT_STORAGE_URL = "memory://"
     
+    # Seconds a cached dashboard summary may be served before it is recomputed
+    DASHBOARD_CACHE_TTL = 30
+    
+    # Batch requests
+    BATCH_MAX_REQUESTS = 20
+    BATCH_MAX_WORKERS = 4
+    
+    # Response compression. COMPRESS_LEVEL (gzip, 1-9) and COMPRESS_BROTLI_QUALITY
+    # (0-11) trade CPU time per response against bytes sent
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = int(os.environ.get('COMPRESS_LEVEL', 6))
+    COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 4))
+    
+    # Production frontend build served by Flask when present
+    FRONTEND_DIST = os.path.join(BASE_DIR, 'dist')
+    
+    # Logging. Records beyond LOG_QUEUE_SIZE waiting to be written are dropped,
+    # and only LOG_SAMPLE_RATE of per-request access log records are kept
+    LOG_QUEUE_SIZE = 10000
+    LOG_SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE', 0.1))
+    
+    # Background jobs. JOBS_WORKERS processes run jobs, at most
+    # JOBS_PER_USER_CONCURRENCY at a time for each user, and failed attempts
+    # are retried after JOBS_RETRY_BACKOFF seconds, doubling each time. A
+    # running job whose dispatcher has not heartbeated for
+    # JOBS_HEARTBEAT_TIMEOUT seconds is treated as abandoned and retried
+    JOBS_ENABLED = True
+    JOBS_WORKERS = 2
+    JOBS_PER_USER_CONCURRENCY = 1
+    JOBS_MAX_QUEUED_PER_USER = 10
+    JOBS_MAX_ATTEMPTS = 3
+    JOBS_RETRY_BACKOFF = 5
+    JOBS_POLL_INTERVAL = 1.0
+    JOBS_HEARTBEAT_TIMEOUT = 30
+    
     # CORS configuration
     CORS_HEADERS = 'Content-Type'
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    AUTO_MIGRATE = True
+    LOG_SAMPLE_RATE = 1.0
 
 class TestingConfig(Config):
     TESTING = True
+    AUTO_MIGRATE = True
+    DASHBOARD_CACHE_TTL = 0
+    JOBS_ENABLED = False
     # Use absolute path for test database as well
     TEST_DB_PATH = os.path.join(BASE_DIR, 'test.db')
     SQLALCHEMY_DATABASE_URI = f'sqlite:///{TEST_DB_PATH}'
@@ -48,6 +110,6 @@ config_by_name = {
     'production': ProductionConfig
 }
 
-def get_config():
-    env = os.environ.get('FLASK_ENV', 'development')
+def get_config(config_name=None):
+    env = config_name or os.environ.get('FLASK_ENV', 'development')
     return config_by_name[env]
\ No newline at end of file
@@ -0,0 +1,401 @@
+import json
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import select, update, func
+from sqlalchemy.orm.exc import StaleDataError
+from .models.user import db
+from .models.job import Job
+from .models.task import Task
+from .models.project import Project
+from .models.data_version import touch_user_data
+from .projections import task_list_query, task_row_to_dict
+
+# Rows deleted, updated or exported per transaction, progress is reported after each
+CHUNK_SIZE = 500
+
+jobs_table = Job.__table__
+tasks_table = Task.__table__
+
+# Job handlers. Each runs in a worker process inside an app context, receives
+# the job, its params and a progress(done, total) callback, and returns a
+# JSON-serializable result. Handlers may be retried, so they must be idempotent.
+
+def delete_tasks(job, params, progress):
+    """Delete the user's tasks matching a status and/or a list of ids"""
+    query = select(tasks_table.c.id).where(tasks_table.c.user_id == job.user_id)
+    if params.get('status'):
+        query = query.where(tasks_table.c.status == params['status'])
+    if params.get('ids'):
+        query = query.where(tasks_table.c.id.in_(params['ids']))
+    ids = db.session.execute(query).scalars().all()
+    
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start:start + CHUNK_SIZE]
+        db.session.execute(tasks_table.delete().where(tasks_table.c.id.in_(chunk)))
+        touch_user_data(db.session, [job.user_id])
+        db.session.commit()
+        progress(start + len(chunk), len(ids))
+    
+    return {'deleted': len(ids)}
+
+def delete_project(job, params, progress):
+    """Delete a project, detaching its tasks in chunks first"""
+    project = Project.query.filter_by(id=params['project_id'], user_id=job.user_id).first()
+    if not project:
+        # Already deleted by an earlier attempt
+        return {'project_id': params['project_id'], 'tasks_detached': 0}
+    
+    total = Task.query.filter_by(project_id=project.id).count()
+    detached = 0
+    while True:
+        chunk = (
+            select(tasks_table.c.id)
+            .where(tasks_table.c.project_id == project.id)
+            .limit(CHUNK_SIZE)
+            .correlate(None)
+        )
+        result = db.session.execute(
+            tasks_table.update().where(tasks_table.c.id.in_(chunk)).values(project_id=None)
+        )
+        if result.rowcount:
+            touch_user_data(db.session, [job.user_id])
+        db.session.commit()
+        if result.rowcount == 0:
+            break
+        detached += result.rowcount
+        progress(detached, total)
+    
+    db.session.delete(project)
+    db.session.commit()
+    return {'project_id': params['project_id'], 'tasks_detached': detached}
+
+def export_tasks(job, params, progress):
+    """Export the user's tasks matching the task list filters"""
+    statement, bind_params = task_list_query(job.user_id, params)
+    total = db.session.execute(select(func.count()).select_from(statement.subquery()), bind_params).scalar()
+    
+    tasks = []
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            statement
+            .where(tasks_table.c.id > last_id)
+            .order_by(tasks_table.c.id)
+            .limit(CHUNK_SIZE),
+            bind_params
+        ).all()
+        if not rows:
+            break
+        tasks.extend(task_row_to_dict(row) for row in rows)
+        last_id = rows[-1].id
+        progress(len(tasks), total)
+    
+    return {'count': len(tasks), 'tasks': tasks}
+
+JOB_HANDLERS = {
+    'delete_tasks': delete_tasks,
+    'delete_project': delete_project,
+    'export_tasks': export_tasks
+}
+
+def enqueue_job(user_id, job_type, params):
+    """Queue a job and wake this process's job runner"""
+    job = Job(
+        user_id=user_id,
+        type=job_type,
+        params=json.dumps(params),
+        max_attempts=current_app.config['JOBS_MAX_ATTEMPTS']
+    )
+    db.session.add(job)
+    db.session.commit()
+    
+    runner = current_app.extensions.get('job_runner')
+    if runner:
+        runner.notify()
+    return job
+
+def fail_job(job, error):
+    """Record a failed attempt, scheduling a retry with exponential backoff if attempts remain"""
+    job.error = error
+    if job.attempts < job.max_attempts:
+        delay = current_app.config['JOBS_RETRY_BACKOFF'] * 2 ** max(job.attempts - 1, 0)
+        job.status = 'queued'
+        job.run_after = datetime.utcnow() + timedelta(seconds=delay)
+    else:
+        job.status = 'failed'
+        job.finished_at = datetime.utcnow()
+
+def run_job(job_id, attempt=None):
+    """
+    Run a claimed job, recording its result or scheduling a retry. Returns the
+    job's new status, or None if the job was deleted or this attempt was
+    abandoned and the job claimed again in the meantime.
+    """
+    job = db.session.get(Job, job_id)
+    if job is None or job.status != 'running' or attempt not in (None, job.attempts):
+        return None
+    attempt = job.attempts
+    
+    def check_attempt():
+        # Commits expire the job, so this reloads it. The version check on
+        # attempts then covers the write that follows.
+        if job.attempts != attempt:
+            raise StaleDataError(f"Job {job_id} was claimed again")
+    
+    def progress(done, total):
+        check_attempt()
+        job.progress = min(100, done * 100 // total) if total else 100
+        db.session.commit()
+    
+    try:
+        try:
+            result = JOB_HANDLERS[job.type](job, json.loads(job.params), progress)
+        except StaleDataError:
+            raise
+        except Exception as e:
+            db.session.rollback()
+            check_attempt()
+            current_app.logger.exception("Job %s failed on attempt %s", job_id, attempt)
+            fail_job(job, str(e))
+        else:
+            check_attempt()
+            job.status = 'completed'
+            job.progress = 100
+            job.result = json.dumps(result)
+            job.error = None
+            job.finished_at = datetime.utcnow()
+        
+        db.session.commit()
+    except StaleDataError:
+        db.session.rollback()
+        current_app.logger.warning("Job %s attempt %s was superseded, discarding its outcome", job_id, attempt)
+        return None
+    return job.status
+
+def claim_jobs(limit, per_user_limit):
+    """
+    Atomically mark up to `limit` due jobs as running, skipping users who
+    already have `per_user_limit` jobs running. Returns (job_id, user_id, attempt)
+    for each claimed job, where attempt is the job's new attempt count.
+    
+    Candidates are taken round-robin across users, each user's oldest due job
+    first, so one user's backlog never holds back the jobs of others.
+    """
+    now = datetime.utcnow()
+    running_jobs = jobs_table.alias('running_jobs')
+    busy_users = (
+        select(running_jobs.c.user_id)
+        .where(running_jobs.c.status == 'running')
+        .group_by(running_jobs.c.user_id)
+        .having(func.count(running_jobs.c.id) >= per_user_limit)
+    )
+    due = (
+        select(
+            jobs_table.c.id,
+            jobs_table.c.user_id,
+            jobs_table.c.attempts,
+            jobs_table.c.run_after,
+            func.row_number().over(
+                partition_by=jobs_table.c.user_id,
+                order_by=(jobs_table.c.run_after, jobs_table.c.id)
+            ).label('user_rank')
+        )
+        .where(
+            jobs_table.c.status == 'queued',
+            jobs_table.c.run_after <= now,
+            jobs_table.c.user_id.notin_(busy_users)
+        )
+        .subquery()
+    )
+    candidates = db.session.execute(
+        select(due.c.id, due.c.user_id, due.c.attempts)
+        .where(due.c.user_rank <= per_user_limit)
+        .order_by(due.c.user_rank, due.c.run_after, due.c.id)
+        .limit(limit * 4)
+    ).all()
+    
+    claimed = []
+    for job_id, user_id, attempts in candidates:
+        if len(claimed) >= limit:
+            break
+        running = (
+            select(func.count(running_jobs.c.id))
+            .where(running_jobs.c.user_id == user_id, running_jobs.c.status == 'running')
+            .scalar_subquery()
+        )
+        # The status and per-user checks happen in the UPDATE itself, so
+        # several app processes can dispatch from the same table safely
+        result = db.session.execute(
+            update(jobs_table)
+            .where(
+                jobs_table.c.id == job_id,
+                jobs_table.c.status == 'queued',
+                jobs_table.c.attempts == attempts,
+                running < per_user_limit
+            )
+            .values(status='running', attempts=attempts + 1, started_at=now, heartbeat_at=now, updated_at=now)
+        )
+        db.session.commit()
+        if result.rowcount == 1:
+            claimed.append((job_id, user_id, attempts + 1))
+    return claimed
+
+def heartbeat_jobs(job_ids):
+    """Mark running jobs as still in flight in a live dispatcher"""
+    if not job_ids:
+        return
+    db.session.execute(
+        update(jobs_table)
+        .where(jobs_table.c.id.in_(job_ids), jobs_table.c.status == 'running')
+        .values(heartbeat_at=datetime.utcnow())
+    )
+    db.session.commit()
+
+def requeue_abandoned_jobs(timeout, in_flight=()):
+    """
+    Fail attempts whose dispatcher has not heartbeated for `timeout` seconds,
+    e.g. because its process crashed. Jobs in `in_flight` are never touched.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=timeout)
+    abandoned = Job.query.filter(
+        Job.status == 'running',
+        func.coalesce(Job.heartbeat_at, Job.started_at) < cutoff,
+        Job.id.notin_(in_flight)
+    )
+    for job in abandoned.all():
+        fail_job(job, "Job abandoned by its dispatcher")
+    try:
+        db.session.commit()
+    except StaleDataError:
+        # Another dispatcher requeued or claimed one of them first
+        db.session.rollback()
+
+# Worker process side. Each worker builds its own app from the parent's config.
+worker_app = None
+
+def init_worker(config):
+    global worker_app
+    from .app import create_app
+    worker_app = create_app(config_overrides=config)
+
+def execute(job_id, attempt):
+    with worker_app.app_context():
+        return run_job(job_id, attempt)
+
+class JobRunner:
+    """
+    Dispatches queued jobs from the jobs table to a pool of worker processes.
+    A dispatcher thread polls for due jobs and is woken early when a job is
+    queued from this process or a running job finishes. On every poll it also
+    heartbeats the jobs it has in flight, so dispatchers in other processes
+    only retry jobs whose dispatcher is gone.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+        self.executor = None
+        self.executor_config = None
+        self.thread = None
+        self.running = set()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+    
+    def start(self):
+        if self.thread is not None:
+            return
+        
+        config = {key: value for key, value in self.app.config.items() if key.isupper()}
+        config['JOBS_ENABLED'] = False
+        self.executor_config = config
+        self.executor = self.create_executor()
+        self.thread = threading.Thread(target=self.run, name='job-dispatcher', daemon=True)
+        self.thread.start()
+    
+    def create_executor(self):
+        # Spawned rather than forked, the parent has threads running
+        return ProcessPoolExecutor(
+            max_workers=self.app.config['JOBS_WORKERS'],
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_worker,
+            initargs=(self.executor_config,)
+        )
+    
+    def replace_executor(self, broken):
+        """Replace a pool broken by a dead worker process, it accepts no more work"""
+        with self.lock:
+            if self.executor is not broken:
+                return
+            self.executor = self.create_executor()
+        broken.shutdown(wait=False)
+        self.app.logger.warning("Job worker pool broke and was replaced")
+    
+    def abandon(self, job_id, error):
+        """Schedule a retry for a job whose worker never reported an outcome"""
+        with self.lock:
+            self.running.discard(job_id)
+        
+        job = db.session.get(Job, job_id)
+        if job is None or job.status != 'running':
+            return
+        fail_job(job, f"Worker failed: {error}")
+        try:
+            db.session.commit()
+        except StaleDataError:
+            db.session.rollback()
+    
+    def notify(self):
+        self.wakeup.set()
+    
+    def run(self):
+        while True:
+            try:
+                with self.app.app_context():
+                    self.dispatch()
+            except Exception:
+                self.app.logger.exception("Job dispatch failed")
+            self.wakeup.wait(self.app.config['JOBS_POLL_INTERVAL'])
+            self.wakeup.clear()
+    
+    def dispatch(self):
+        with self.lock:
+            in_flight = list(self.running)
+        heartbeat_jobs(in_flight)
+        requeue_abandoned_jobs(self.app.config['JOBS_HEARTBEAT_TIMEOUT'], in_flight)
+        
+        capacity = self.app.config['JOBS_WORKERS'] - len(in_flight)
+        if capacity <= 0:
+            return
+        
+        for job_id, _, attempt in claim_jobs(capacity, self.app.config['JOBS_PER_USER_CONCURRENCY']):
+            with self.lock:
+                self.running.add(job_id)
+                executor = self.executor
+            try:
+                future = executor.submit(execute, job_id, attempt)
+            except BrokenProcessPool as e:
+                self.replace_executor(executor)
+                self.abandon(job_id, e)
+                continue
+            future.add_done_callback(
+                lambda future, job_id=job_id, executor=executor:
+                    self.finished(job_id, executor, future)
+            )
+    
+    def finished(self, job_id, executor, future):
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            self.replace_executor(executor)
+        
+        with self.app.app_context():
+            if error is None:
+                with self.lock:
+                    self.running.discard(job_id)
+            else:
+                # The worker process died before it could record the outcome
+                self.abandon(job_id, error)
+        
+        self.wakeup.set()
@@ -1,4 +1,7 @@
 # Import models to make them available when importing from models package
 from .user import User
 from .task import Task
-from .project import Project
\ No newline at end of file
+from .project import Project
+from .job import Job
+# Registers the flush hook keeping users.data_version current
+from .data_version import touch_user_data, get_data_version
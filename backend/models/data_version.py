@@ -0,0 +1,44 @@
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from .user import db, User
+from .task import Task
+from .project import Project
+
+# users.data_version is bumped in every transaction that writes a user's tasks
+# or projects, so any process can tell whether something it computed from
+# them, such as a cached dashboard summary, is still current.
+
+users_table = User.__table__
+
+def touch_user_data(conn, user_ids):
+    """
+    Bump the data version of users whose tasks or projects are being written,
+    inside the writing transaction. Bulk statements bypass the flush hook
+    below, so code issuing them must call this itself.
+    """
+    if not user_ids:
+        return
+    
+    conn.execute(
+        users_table.update()
+        .where(users_table.c.id.in_(sorted(user_ids)))
+        # Setting updated_at to itself keeps its onupdate from firing, since
+        # the profile has not changed
+        .values(
+            data_version=func.coalesce(users_table.c.data_version, 0) + 1,
+            updated_at=users_table.c.updated_at
+        )
+    )
+
+def get_data_version(user_id):
+    """The current data version of a user"""
+    return db.session.execute(select(users_table.c.data_version).where(users_table.c.id == user_id)).scalar()
+
+@event.listens_for(Session, 'after_flush')
+def touch_written_users(session, flush_context):
+    user_ids = {
+        instance.user_id
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted)
+        if isinstance(instance, (Task, Project))
+    }
+    touch_user_data(session.connection(), user_ids)
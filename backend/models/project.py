@@ -11,10 +11,13 @@ class Project(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Foreign keys
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     
     # Relationships
-    tasks = db.relationship('Task', backref='project', lazy=True)
+    # Dynamic so the task count is a COUNT query rather than a load of every
+    # task. Deletes are passive: whoever deletes a project detaches its tasks
+    # first with a bulk update instead of the ORM loading them one by one
+    tasks = db.relationship('Task', backref='project', lazy='dynamic', passive_deletes=True)
 
     def to_dict(self):
         return {
@@ -24,7 +27,7 @@ class Project(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'user_id': self.user_id,
-            'task_count': len(self.tasks) if self.tasks else 0
+            'task_count': self.tasks.count()
         }
     
     def __repr__(self):
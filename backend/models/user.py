@@ -1,6 +1,5 @@
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
-from passlib.hash import pbkdf2_sha256 as sha256
 
 db = SQLAlchemy()
 
@@ -13,6 +12,9 @@ class User(db.Model):
     password_hash = db.Column(db.String(128), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Bumped on every write to the user's tasks or projects, so every process
+    # can tell whether a cached summary of them is still current
+    data_version = db.Column(db.Integer, default=0)
     
     # Relationships
     tasks = db.relationship('Task', backref='user', lazy=True, cascade='all, delete-orphan')
@@ -23,12 +25,16 @@ class User(db.Model):
         self.email = email
         self.password_hash = self.generate_hash(password)
 
+    # passlib is imported on first use since only registration, login and
+    # password changes need it
     @staticmethod
     def generate_hash(password):
+        from passlib.hash import pbkdf2_sha256 as sha256
         return sha256.hash(password)
     
     @staticmethod
     def verify_hash(password, hash_):
+        from passlib.hash import pbkdf2_sha256 as sha256
         return sha256.verify(password, hash_)
     
     def to_dict(self):
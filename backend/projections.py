@@ -0,0 +1,113 @@
+from datetime import datetime
+from functools import lru_cache
+from sqlalchemy import select, func, or_, bindparam
+from .models.task import Task
+from .models.project import Project
+
+# Read-only projections of the task and project tables. List routes select
+# plain column tuples with these statements and serialize the rows directly,
+# skipping ORM instances and the session identity map. Statements only hold
+# bind parameters, so each combination of filters is built once and its
+# compiled form is reused from SQLAlchemy's compiled cache.
+
+tasks_table = Task.__table__
+projects_table = Project.__table__
+
+# Columns in the order their rows are unpacked by the serializers below
+TASK_COLUMNS = tuple(tasks_table.c[name] for name in (
+    'id', 'title', 'description', 'due_date', 'priority', 'status',
+    'created_at', 'updated_at', 'user_id', 'project_id'
+))
+PROJECT_COLUMNS = tuple(projects_table.c[name] for name in (
+    'id', 'name', 'description', 'created_at', 'updated_at', 'user_id'
+))
+
+TASK_CRITERIA = {
+    'user_id': tasks_table.c.user_id == bindparam('user_id'),
+    'status': tasks_table.c.status == bindparam('status'),
+    'priority': tasks_table.c.priority == bindparam('priority'),
+    'project_id': tasks_table.c.project_id == bindparam('project_id'),
+    'due_date': tasks_table.c.due_date <= bindparam('due_date'),
+    'search': or_(
+        tasks_table.c.title.ilike(bindparam('search')),
+        tasks_table.c.description.ilike(bindparam('search'))
+    )
+}
+
+def task_row_to_dict(row):
+    """Serialize a row of TASK_COLUMNS into the same shape as Task.to_dict()"""
+    task_id, title, description, due_date, priority, status, created_at, updated_at, user_id, project_id = row
+    return {
+        'id': task_id,
+        'title': title,
+        'description': description,
+        'due_date': due_date.isoformat() if due_date else None,
+        'priority': priority,
+        'status': status,
+        'created_at': created_at.isoformat() if created_at else None,
+        'updated_at': updated_at.isoformat() if updated_at else None,
+        'user_id': user_id,
+        'project_id': project_id
+    }
+
+def project_row_to_dict(row):
+    """Serialize a row of PROJECT_COLUMNS and a task count into the same shape as Project.to_dict()"""
+    project_id, name, description, created_at, updated_at, user_id, task_count = row
+    return {
+        'id': project_id,
+        'name': name,
+        'description': description,
+        'created_at': created_at.isoformat() if created_at else None,
+        'updated_at': updated_at.isoformat() if updated_at else None,
+        'user_id': user_id,
+        'task_count': task_count
+    }
+
+def task_filter_params(user_id, args):
+    """
+    Build the bind parameters for a task listing from request query arguments,
+    one per filter in use. Raises ValueError if the due date is not a valid ISO format date.
+    """
+    params = {'user_id': user_id}
+    
+    for name in ('status', 'priority', 'project_id'):
+        if args.get(name):
+            params[name] = args.get(name)
+    
+    due_date = args.get('due_date')
+    if due_date:
+        try:
+            params['due_date'] = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
+        except (ValueError, TypeError):
+            raise ValueError("Invalid due date format")
+    
+    search = args.get('search')
+    if search:
+        params['search'] = f'%{search}%'
+    
+    return params
+
+@lru_cache(maxsize=None)
+def task_list_statement(filters):
+    """Select the task columns matching a sorted tuple of filter names"""
+    return select(*TASK_COLUMNS).where(*(TASK_CRITERIA[name] for name in filters))
+
+def task_list_query(user_id, args):
+    """The cached statement and its bind parameters for a task listing"""
+    params = task_filter_params(user_id, args)
+    return task_list_statement(tuple(sorted(params))), params
+
+@lru_cache(maxsize=None)
+def project_list_statement(by_id=False):
+    """Select a user's projects with their task counts, or one project when `by_id` is set"""
+    criteria = [projects_table.c.user_id == bindparam('user_id')]
+    if by_id:
+        criteria.append(projects_table.c.id == bindparam('project_id'))
+    
+    task_count = func.count(tasks_table.c.id).label('task_count')
+    return (
+        select(*PROJECT_COLUMNS, task_count)
+        .select_from(projects_table.outerjoin(tasks_table, tasks_table.c.project_id == projects_table.c.id))
+        .where(*criteria)
+        .group_by(projects_table.c.id)
+    )
@@ -1,4 +1,8 @@
 # Import routes to make them available when importing from routes package
 from .auth import auth_bp
 from .tasks import tasks_bp
-from .projects import projects_bp
\ No newline at end of file
+from .projects import projects_bp
+from .dashboard import dashboard_bp
+from .batch import batch_bp
+from .frontend import frontend_bp
+from .jobs import jobs_bp
\ No newline at end of file
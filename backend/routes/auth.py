@@ -25,12 +25,10 @@ def register():
     
     # Check if user already exists
     if User.query.filter_by(email=data['email']).first():
-        current_app.logger.warning(f"Registration attempt with existing email: {data['email']}")
+        current_app.logger.warning("Registration attempt with existing email")
         return error_response("User already exists", status_code=409)
     
     try:
-        current_app.logger.info(f"Attempting to register new user with email: {data['email']}")
-        
         # Create new user
         new_user = User(
             name=data['name'],
@@ -41,7 +39,7 @@ def register():
         db.session.add(new_user)
         db.session.commit()
         
-        current_app.logger.info(f"User registered successfully: {new_user.id}")
+        current_app.logger.info("User registered successfully: %s", new_user.id, extra={'user_id': new_user.id})
         
         # Generate tokens
         access_token = create_access_token(identity=new_user.id)
@@ -54,7 +52,7 @@ def register():
         }, "User registered successfully", status_code=201)
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Error creating user: {str(e)}")
+        current_app.logger.error("Error creating user: %s", e)
         return error_response(f"Error creating user: {str(e)}", status_code=500)
 
 @auth_bp.route('/login', methods=['POST'])
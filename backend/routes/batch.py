@@ -0,0 +1,150 @@
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, request, current_app
+from flask_jwt_extended import JWTManager, jwt_required, get_jwt
+from werkzeug.exceptions import HTTPException
+from werkzeug.test import EnvironBuilder
+from ..utils import success_response, error_response
+from ..utils.concurrency import priority, PRIORITY_BULK
+
+batch_bp = Blueprint('batch', __name__, url_prefix='/api/batch')
+
+class BatchJWTManager(JWTManager):
+    """
+    JWTManager that lets batch sub-requests reuse the token their batch
+    already verified, so a batch decodes and verifies its JWT once. Every
+    other request, and any token other than the batch's, is decoded normally.
+    """
+    
+    # Overrides a private method, Flask-JWT-Extended has no hook that skips decoding
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        verified = request.environ.get('backend.batch_jwt')
+        if verified is not None and verified[0] == encoded_token:
+            return dict(verified[1])
+        return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+ALLOWED_METHODS = ('GET', 'POST', 'PUT', 'DELETE')
+
+def validate_batch_data(data, max_requests):
+    """Validate batch request data"""
+    errors = {}
+    
+    sub_requests = data.get('requests') if isinstance(data, dict) else None
+    if not isinstance(sub_requests, list) or not sub_requests:
+        errors['requests'] = "Requests must be a non-empty list"
+    elif len(sub_requests) > max_requests:
+        errors['requests'] = f"A batch may contain at most {max_requests} requests"
+    else:
+        for index, sub_request in enumerate(sub_requests):
+            if not isinstance(sub_request, dict):
+                errors[str(index)] = "Request must be an object"
+                continue
+            
+            method = sub_request.get('method', 'GET')
+            path = sub_request.get('path')
+            if not isinstance(method, str) or method.upper() not in ALLOWED_METHODS:
+                errors[str(index)] = f"Method must be one of: {', '.join(ALLOWED_METHODS)}"
+            elif not isinstance(path, str) or not path.startswith('/api/'):
+                errors[str(index)] = "Path must start with /api/"
+            elif not isinstance(sub_request.get('query', ''), (str, dict)):
+                errors[str(index)] = "Query must be a string or an object"
+    
+    return len(errors) == 0, errors
+
+# Client address keys copied from the batch, so per-client rate limits count
+# sub-requests against the client that sent them
+CLIENT_ENVIRON_KEYS = ('REMOTE_ADDR', 'HTTP_X_FORWARDED_FOR')
+
+def build_environ(sub_request, parent, headers, verified_jwt):
+    """
+    Build the WSGI environ of a sub-request from the batch `parent` request,
+    keeping its host and client address and carrying its verified token
+    """
+    environ = EnvironBuilder(
+        path=sub_request['path'],
+        method=sub_request.get('method', 'GET').upper(),
+        query_string=sub_request.get('query'),
+        json=sub_request.get('body'),
+        headers=headers,
+        base_url=parent.url_root,
+        environ_base={key: parent.environ[key] for key in CLIENT_ENVIRON_KEYS if key in parent.environ}
+    ).get_environ()
+    environ['backend.sub_request'] = True
+    environ['backend.batch_jwt'] = verified_jwt
+    return environ
+
+def matched_endpoint(app, environ):
+    """The endpoint a sub-request routes to after path decoding, or None if it matches none"""
+    try:
+        endpoint, _ = app.url_map.bind_to_environ(environ).match()
+    except HTTPException:
+        return None
+    return endpoint
+
+def dispatch(app, environ):
+    """
+    Run a sub-request through the application's normal request handling and
+    return its status and JSON body. When called inside the batch request the
+    app context, and with it the database session, is shared.
+    """
+    with app.request_context(environ):
+        try:
+            response = app.full_dispatch_request()
+        except Exception as e:
+            response = app.handle_exception(e)
+    
+    return {
+        'status': response.status_code,
+        'body': response.get_json(silent=True)
+    }
+
+def dispatch_in_thread(app, environ):
+    with app.app_context():
+        return dispatch(app, environ)
+
+@batch_bp.route('', methods=['POST'])
+@jwt_required()
+@priority(PRIORITY_BULK)
+def batch():
+    if request.environ.get('backend.sub_request'):
+        return error_response("Batch requests cannot be nested", status_code=400)
+    
+    data = request.get_json()
+    
+    # Validate batch data
+    is_valid, errors = validate_batch_data(data, current_app.config['BATCH_MAX_REQUESTS'])
+    if not is_valid:
+        return error_response("Invalid batch request", errors, status_code=400)
+    
+    app = current_app._get_current_object()
+    sub_requests = data['requests']
+    authorization = request.headers['Authorization']
+    headers = {
+        'Authorization': authorization,
+        # Sub-requests are logged under the batch's request id
+        'X-Request-ID': request.environ.get('backend.request_id', '')
+    }
+    verified_jwt = (authorization.split(None, 1)[-1], get_jwt())
+    environs = [build_environ(sub_request, request, headers, verified_jwt) for sub_request in sub_requests]
+    
+    # Checked on the routed endpoint, paths are percent-decoded before routing
+    nested = {
+        str(index): "Batch requests cannot be nested"
+        for index, environ in enumerate(environs)
+        if matched_endpoint(app, environ) == request.endpoint
+    }
+    if nested:
+        return error_response("Invalid batch request", nested, status_code=400)
+    
+    # Independent reads may run concurrently, each thread with its own session
+    parallel = data.get('parallel') and all(
+        sub_request.get('method', 'GET').upper() == 'GET' for sub_request in sub_requests
+    )
+    
+    if parallel:
+        workers = min(len(sub_requests), current_app.config['BATCH_MAX_WORKERS'])
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = list(executor.map(lambda environ: dispatch_in_thread(app, environ), environs))
+    else:
+        responses = [dispatch(app, environ) for environ in environs]
+    
+    return success_response(responses, "Batch processed successfully")
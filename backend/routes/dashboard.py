@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from flask import Blueprint, request, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import case, func, select
+from ..models.user import db
+from ..models.task import Task
+from ..models.project import Project
+from ..models.data_version import get_data_version
+from ..utils import success_response, error_response
+from ..utils.cache import UserCache
+
+dashboard_bp = Blueprint('dashboard', __name__, url_prefix='/api/dashboard')
+
+# Summaries are cached per user until the next write to their tasks or
+# projects, tracked by the user's data version so writes made by other worker
+# processes and by background jobs are seen too (see models/data_version.py)
+summary_cache = UserCache()
+
+MAX_URGENT_TASKS = 50
+
+def count_if(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+def summary_query(user_id, now):
+    """
+    Per-project task counts for a user in a single aggregate query.
+    Every count is a conditional SUM over the user's rows, so the totals
+    for the dashboard are the sums of the per-project rows.
+    """
+    # The week ends at midnight before next Monday
+    week_end = datetime(now.year, now.month, now.day) + timedelta(days=7 - now.weekday())
+    is_open = Task.status != 'completed'
+    
+    return (
+        select(
+            Task.project_id,
+            Project.name.label('project_name'),
+            func.count(Task.id).label('total'),
+            count_if(Task.status == 'todo').label('todo'),
+            count_if(Task.status == 'in-progress').label('in_progress'),
+            count_if(Task.status == 'completed').label('completed'),
+            count_if(Task.priority == 'high').label('high'),
+            count_if(Task.priority == 'medium').label('medium'),
+            count_if(Task.priority == 'low').label('low'),
+            count_if(is_open & (Task.due_date < now)).label('overdue'),
+            count_if(is_open & (Task.due_date >= now) & (Task.due_date < week_end)).label('due_this_week')
+        )
+        .select_from(Task)
+        .outerjoin(Project, Project.id == Task.project_id)
+        .where(Task.user_id == user_id)
+        .group_by(Task.project_id, Project.name)
+    )
+
+def urgent_tasks_query(user_id, limit):
+    """The user's open tasks, earliest due first, then by priority"""
+    priority_rank = case((Task.priority == 'high', 0), (Task.priority == 'medium', 1), else_=2)
+    
+    return (
+        Task.query
+        .filter(Task.user_id == user_id, Task.status != 'completed')
+        .order_by(Task.due_date.is_(None), Task.due_date, priority_rank, Task.id)
+        .limit(limit)
+    )
+
+def build_summary(user_id, limit):
+    counts = dict.fromkeys(
+        ['total', 'todo', 'in_progress', 'completed', 'high', 'medium', 'low', 'overdue', 'due_this_week'], 0
+    )
+    projects = []
+    
+    for row in db.session.execute(summary_query(user_id, datetime.utcnow())):
+        for key in counts:
+            counts[key] += row._mapping[key]
+        if row.project_id is not None:
+            projects.append({
+                'project_id': row.project_id,
+                'name': row.project_name,
+                'total': row.total,
+                'todo': row.todo,
+                'in_progress': row.in_progress,
+                'completed': row.completed,
+                'overdue': row.overdue,
+                'due_this_week': row.due_this_week
+            })
+    
+    return {
+        'status_counts': {
+            'todo': counts['todo'],
+            'in_progress': counts['in_progress'],
+            'completed': counts['completed'],
+            'total': counts['total']
+        },
+        'priority_counts': {
+            'high': counts['high'],
+            'medium': counts['medium'],
+            'low': counts['low']
+        },
+        'overdue': counts['overdue'],
+        'due_this_week': counts['due_this_week'],
+        'projects': projects,
+        'urgent_tasks': [task.to_dict() for task in urgent_tasks_query(user_id, limit)]
+    }
+
+@dashboard_bp.route('', methods=['GET'])
+@jwt_required()
+def get_dashboard():
+    current_user_id = get_jwt_identity()
+    
+    try:
+        limit = int(request.args.get('limit', 5))
+    except ValueError:
+        return error_response("Limit must be an integer", status_code=400)
+    
+    if not 0 <= limit <= MAX_URGENT_TASKS:
+        return error_response(f"Limit must be between 0 and {MAX_URGENT_TASKS}", status_code=400)
+    
+    version = get_data_version(current_user_id)
+    summary = summary_cache.get(current_user_id, limit, version)
+    if summary is None:
+        summary = build_summary(current_user_id, limit)
+        summary_cache.set(current_user_id, limit, version, summary, current_app.config['DASHBOARD_CACHE_TTL'])
+    
+    return success_response(summary, "Dashboard retrieved successfully")
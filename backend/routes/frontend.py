@@ -0,0 +1,52 @@
+import os
+import mimetypes
+from flask import Blueprint, current_app, send_from_directory, abort
+from werkzeug.security import safe_join
+from ..utils.compression import accepted_encoding
+
+# Serves the production build written to FRONTEND_DIST by `npm run build`:
+# content-hashed files under /assets/ with .br/.gz variants next to them,
+# and index.html for every other non-API path so client-side routes load.
+frontend_bp = Blueprint('frontend', __name__)
+
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+PRECOMPRESSED_EXTENSIONS = {'br': '.br', 'gzip': '.gz'}
+
+@frontend_bp.route('/assets/<path:filename>')
+def asset(filename):
+    assets_dir = os.path.join(current_app.config['FRONTEND_DIST'], 'assets')
+    path = safe_join(assets_dir, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    
+    available = [
+        encoding for encoding, extension in PRECOMPRESSED_EXTENSIONS.items()
+        if os.path.isfile(path + extension)
+    ]
+    encoding = accepted_encoding(available)
+    
+    # Asset filenames change with their content, so they can be cached forever
+    response = send_from_directory(
+        assets_dir,
+        filename + PRECOMPRESSED_EXTENSIONS[encoding] if encoding else filename,
+        mimetype=mimetypes.guess_type(filename)[0],
+        max_age=ASSET_MAX_AGE
+    )
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.immutable = True
+    response.cache_control.public = True
+    return response
+
+@frontend_bp.route('/', defaults={'path': ''})
+@frontend_bp.route('/<path:path>')
+def index(path):
+    if path.startswith('api/'):
+        abort(404)
+    
+    # index.html references the current asset names, so it must always be revalidated
+    response = send_from_directory(current_app.config['FRONTEND_DIST'], 'index.html')
+    response.cache_control.no_cache = True
+    return response
@@ -0,0 +1,55 @@
+from flask import Blueprint, request, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from ..models.job import Job
+from ..models.project import Project
+from ..utils import validate_job_data, success_response, error_response
+from ..utils.concurrency import priority, PRIORITY_BULK
+from .. import job_queue
+
+jobs_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
+
+@jobs_bp.route('', methods=['POST'])
+@jwt_required()
+@priority(PRIORITY_BULK)
+def create_job():
+    current_user_id = get_jwt_identity()
+    data = request.get_json()
+    
+    # Validate job data
+    is_valid, errors = validate_job_data(data)
+    if not is_valid:
+        return error_response("Invalid job data", errors, status_code=400)
+    
+    params = data.get('params', {})
+    
+    # Check the project exists and belongs to user before queueing its deletion
+    if data['type'] == 'delete_project':
+        project = Project.query.filter_by(id=params['project_id'], user_id=current_user_id).first()
+        if not project:
+            return error_response("Project not found", status_code=404)
+    
+    # Limit how many jobs a user can have waiting or running
+    active_jobs = Job.query.filter(
+        Job.user_id == current_user_id,
+        Job.status.in_(['queued', 'running'])
+    ).count()
+    if active_jobs >= current_app.config['JOBS_MAX_QUEUED_PER_USER']:
+        return error_response("Too many jobs in progress", status_code=429)
+    
+    try:
+        job = job_queue.enqueue_job(current_user_id, data['type'], params)
+        return success_response(job.to_dict(), "Job queued successfully", status_code=202)
+    except Exception as e:
+        return error_response(f"Error queueing job: {str(e)}", status_code=500)
+
+@jobs_bp.route('/<int:job_id>', methods=['GET'])
+@jwt_required()
+def get_job(job_id):
+    current_user_id = get_jwt_identity()
+    
+    job = Job.query.filter_by(id=job_id, user_id=current_user_id).first()
+    
+    if not job:
+        return error_response("Job not found", status_code=404)
+    
+    return success_response(job.to_dict(), "Job retrieved successfully")
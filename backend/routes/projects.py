@@ -1,7 +1,9 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from ..models.user import db
+from ..models.task import Task
 from ..models.project import Project
+from ..projections import project_list_statement, project_row_to_dict
 from ..utils import validate_project_data, success_response, error_response
 
 projects_bp = Blueprint('projects', __name__, url_prefix='/api/projects')
@@ -11,8 +13,8 @@ projects_bp = Blueprint('projects', __name__, url_prefix='/api/projects')
 def get_projects():
     current_user_id = get_jwt_identity()
     
-    projects = Project.query.filter_by(user_id=current_user_id).all()
-    projects_data = [project.to_dict() for project in projects]
+    rows = db.session.execute(project_list_statement(), {'user_id': current_user_id})
+    projects_data = [project_row_to_dict(row) for row in rows]
     
     return success_response(projects_data, "Projects retrieved successfully")
 
@@ -21,12 +23,15 @@ def get_projects():
 def get_project(project_id):
     current_user_id = get_jwt_identity()
     
-    project = Project.query.filter_by(id=project_id, user_id=current_user_id).first()
+    row = db.session.execute(
+        project_list_statement(by_id=True),
+        {'user_id': current_user_id, 'project_id': project_id}
+    ).first()
     
-    if not project:
+    if not row:
         return error_response("Project not found", status_code=404)
     
-    return success_response(project.to_dict(), "Project retrieved successfully")
+    return success_response(project_row_to_dict(row), "Project retrieved successfully")
 
 @projects_bp.route('', methods=['POST'])
 @jwt_required()
@@ -96,6 +101,7 @@ def delete_project(project_id):
         return error_response("Project not found", status_code=404)
     
     try:
+        Task.query.filter_by(project_id=project.id).update({'project_id': None})
         db.session.delete(project)
         db.session.commit()
         return success_response(message="Project deleted successfully")
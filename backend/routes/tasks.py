@@ -1,10 +1,11 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime
-from sqlalchemy import or_
+from sqlalchemy import func
 from ..models.user import db
 from ..models.task import Task
 from ..models.project import Project
+from ..projections import task_list_query, task_row_to_dict
 from ..utils import validate_task_data, success_response, error_response
 
 tasks_bp = Blueprint('tasks', __name__, url_prefix='/api/tasks')
@@ -14,41 +15,13 @@ tasks_bp = Blueprint('tasks', __name__, url_prefix='/api/tasks')
 def get_tasks():
     current_user_id = get_jwt_identity()
     
-    # Get query parameters for filtering
-    status = request.args.get('status')
-    priority = request.args.get('priority')
-    project_id = request.args.get('project_id')
-    due_date = request.args.get('due_date')
-    search = request.args.get('search')
-    
-    # Start with base query for current user's tasks
-    query = Task.query.filter_by(user_id=current_user_id)
-    
-    # Apply filters if provided
-    if status:
-        query = query.filter_by(status=status)
-    
-    if priority:
-        query = query.filter_by(priority=priority)
-    
-    if project_id:
-        query = query.filter_by(project_id=project_id)
-    
-    if due_date:
-        try:
-            due_date_obj = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
-            query = query.filter(Task.due_date <= due_date_obj)
-        except (ValueError, TypeError):
-            return error_response("Invalid due date format", status_code=400)
-    
-    if search:
-        query = query.filter(or_(
-            Task.title.ilike(f'%{search}%'),
-            Task.description.ilike(f'%{search}%')
-        ))
+    try:
+        statement, params = task_list_query(current_user_id, request.args)
+    except ValueError:
+        return error_response("Invalid due date format", status_code=400)
     
-    # Execute query and convert to list of dictionaries
-    tasks = [task.to_dict() for task in query.all()]
+    # Serialize plain rows, a read-only listing has no use for ORM instances
+    tasks = [task_row_to_dict(row) for row in db.session.execute(statement, params)]
     
     return success_response(tasks, "Tasks retrieved successfully")
 
@@ -186,10 +159,16 @@ def delete_task(task_id):
 def get_status_counts():
     current_user_id = get_jwt_identity()
     
-    # Count tasks by status
-    todo_count = Task.query.filter_by(user_id=current_user_id, status='todo').count()
-    in_progress_count = Task.query.filter_by(user_id=current_user_id, status='in-progress').count()
-    completed_count = Task.query.filter_by(user_id=current_user_id, status='completed').count()
+    # Count tasks by status in one grouped query
+    counts = dict(
+        db.session.query(Task.status, func.count(Task.id))
+        .filter(Task.user_id == current_user_id)
+        .group_by(Task.status)
+        .all()
+    )
+    todo_count = counts.get('todo', 0)
+    in_progress_count = counts.get('in-progress', 0)
+    completed_count = counts.get('completed', 0)
     
     return success_response({
         'todo': todo_count,
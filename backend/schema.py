@@ -0,0 +1,67 @@
+from sqlalchemy import select, inspect
+# Importing the models registers their tables on db.metadata
+from .models import User, Task, Project, Job
+from .models.user import db
+
+# Bump whenever a model gains a table, column or index, and teach migrate() to apply it
+SCHEMA_VERSION = 4
+
+schema_version = db.Table(
+    'schema_version',
+    db.Column('version', db.Integer, nullable=False)
+)
+
+def get_schema_version():
+    """
+    Get the schema version recorded in the database.
+    Returns 0 if the database has never been migrated. Any other error, such
+    as the database being locked by another process, is raised.
+    """
+    engine = db.engine
+    if not inspect(engine).has_table(schema_version.name):
+        return 0
+    with engine.connect() as conn:
+        return conn.execute(select(schema_version.c.version)).scalar() or 0
+
+def migrate():
+    """Create missing tables and indexes, then record the current schema version"""
+    engine = db.engine
+    db.create_all()
+    
+    # create_all() skips tables that already exist, so add columns introduced
+    # since. New columns on existing tables must be nullable for this to work.
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}')
+    
+    # create_all() skips tables that already exist, so add indexes introduced since
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    
+    with engine.begin() as conn:
+        conn.execute(schema_version.delete())
+        conn.execute(schema_version.insert().values(version=SCHEMA_VERSION))
+
+def check_schema(app):
+    """
+    Make sure the database schema is current at boot.
+    Migrates if AUTO_MIGRATE is set, otherwise refuses to start on an outdated schema.
+    """
+    version = get_schema_version()
+    if version == SCHEMA_VERSION:
+        return
+    
+    if not app.config['AUTO_MIGRATE']:
+        raise RuntimeError(
+            f"Database schema is at version {version}, expected {SCHEMA_VERSION}. "
+            "Run `python migrate.py` before starting the application."
+        )
+    
+    migrate()
+    app.logger.info("Database migrated from schema version %s to %s", version, SCHEMA_VERSION)
@@ -1,3 +1,3 @@
 # Import utilities to make them available when importing from utils package
-from .validation import validate_email, validate_password, validate_task_data, validate_project_data
+from .validation import validate_email, validate_password, validate_task_data, validate_project_data, validate_job_data
 from .responses import success_response, error_response
\ No newline at end of file
@@ -0,0 +1,49 @@
+import time
+import threading
+from collections import OrderedDict
+
+class UserCache:
+    """
+    In-process cache of per-user values.
+    Each entry records the version of the user's data it was computed from and
+    only hits while the caller still sees that version, so writes made by any
+    process invalidate it. Entries also expire after their TTL, and only the
+    `max_users` most recently used users are kept.
+    """
+    
+    def __init__(self, max_users=1000):
+        self.max_users = max_users
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, user_id, key, version):
+        with self._lock:
+            entries = self._entries.get(user_id)
+            if entries is None:
+                return None
+            self._entries.move_to_end(user_id)
+            entry = entries.get(key)
+        
+        if entry is None or entry[0] < time.monotonic() or entry[1] != version:
+            return None
+        return entry[2]
+    
+    def set(self, user_id, key, version, value, ttl):
+        if ttl <= 0:
+            return
+        
+        now = time.monotonic()
+        with self._lock:
+            entries = self._entries.setdefault(user_id, {})
+            self._entries.move_to_end(user_id)
+            # Drop the user's entries that can no longer hit
+            for stale in [k for k, (expires, v, _) in entries.items() if expires < now or v != version]:
+                del entries[stale]
+            entries[key] = (now + ttl, version, value)
+            
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,54 @@
+import gzip
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = (
+    'application/json', 'application/javascript', 'text/javascript', 'text/html', 'text/css', 'text/plain'
+)
+
+def accepted_encoding(available=('br', 'gzip')):
+    """
+    Pick the content encoding to use for the current request, preferring brotli.
+    Returns None if the client accepts none of the available encodings.
+    """
+    for encoding in available:
+        if encoding == 'br' and brotli is None:
+            continue
+        if request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+def compress(data, encoding, config):
+    if encoding == 'br':
+        return brotli.compress(data, quality=config['COMPRESS_BROTLI_QUALITY'])
+    return gzip.compress(data, compresslevel=config['COMPRESS_LEVEL'])
+
+def init_compression(app):
+    """Compress API responses above COMPRESS_MIN_SIZE for clients that accept it"""
+    
+    @app.after_request
+    def compress_response(response):
+        # File responses are streamed and static assets are served precompressed
+        if (response.direct_passthrough
+                or response.status_code < 200 or response.status_code in (204, 304)
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+        
+        response.vary.add('Accept-Encoding')
+        
+        data = response.get_data()
+        if len(data) < app.config['COMPRESS_MIN_SIZE']:
+            return response
+        
+        encoding = accepted_encoding()
+        if encoding is None:
+            return response
+        
+        response.set_data(compress(data, encoding, app.config))
+        response.headers['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,156 @@
+import time
+import threading
+from flask import request, current_app, jsonify
+
+# Priority classes, highest first. Each class may only use its share of the
+# current limit, so as load rises bulk work is shed first and auth and writes last.
+PRIORITY_CRITICAL = 0
+PRIORITY_READ = 1
+PRIORITY_BULK = 2
+
+PRIORITY_SHARES = {
+    PRIORITY_CRITICAL: 1.0,
+    PRIORITY_READ: 0.8,
+    PRIORITY_BULK: 0.5
+}
+
+def priority(level):
+    """Decorator overriding the load shedding priority class of a view"""
+    def decorator(fn):
+        fn.load_priority = level
+        return fn
+    return decorator
+
+class AIMDLimiter:
+    """
+    Adaptive concurrency limit with additive increase, multiplicative decrease.
+    Each request that completes within the target latency raises the limit by
+    about one per window of requests, and each slower one cuts it by `backoff`,
+    so concurrency settles where latency stays near the target.
+    """
+    
+    def __init__(self, initial_limit, min_limit, max_limit, target_latency, backoff=0.9):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.backoff = backoff
+        self.inflight = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+    
+    def try_acquire(self, priority_class=PRIORITY_CRITICAL):
+        with self._lock:
+            allowed = max(1, int(self.limit * PRIORITY_SHARES[priority_class]))
+            if self.inflight >= allowed:
+                self.rejected += 1
+                return False
+            self.inflight += 1
+            return True
+    
+    def release(self, latency):
+        with self._lock:
+            self.inflight -= 1
+            if latency > self.target_latency:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+            elif self.inflight * 2 >= self.limit:
+                # Only grow while the limit is actually being used
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+def request_priority():
+    view = current_app.view_functions.get(request.endpoint)
+    if hasattr(view, 'load_priority'):
+        return view.load_priority
+    if request.blueprint == 'auth' or request.method not in ('GET', 'HEAD'):
+        return PRIORITY_CRITICAL
+    return PRIORITY_READ
+
+def request_start(environ):
+    """
+    Arrival time of a request as a Unix timestamp from its X-Request-Start
+    header, or None. The header must be set by a front-end proxy (nginx:
+    `proxy_set_header X-Request-Start "t=${msec}";`) or by asgi.py, in
+    seconds, milliseconds or microseconds, optionally prefixed with `t=`.
+    """
+    value = environ.get('HTTP_X_REQUEST_START', '')
+    if value.startswith('t='):
+        value = value[2:]
+    try:
+        timestamp = float(value)
+    except ValueError:
+        return None
+    
+    if timestamp > 1e14:
+        return timestamp / 1e6
+    if timestamp > 1e11:
+        return timestamp / 1e3
+    return timestamp
+
+def init_load_shedding(app):
+    """
+    Reject requests with 503 and Retry-After before they reach the route
+    handlers once the adaptive concurrency limit for their priority is reached,
+    or once they have waited too long for a thread.
+    
+    Latency is measured from the request's arrival, so time spent queued in
+    front of the worker's threads counts. Arrival comes from X-Request-Start
+    when CONCURRENCY_TRUST_REQUEST_START is set, otherwise from entry into the
+    WSGI app, which misses any queue in front of it.
+    
+    Reads and bulk requests that queued longer than their priority's share of
+    CONCURRENCY_MAX_QUEUE_DELAY are shed without running. Auth and writes are
+    only subject to the limit, so they are shed last.
+    """
+    threads = app.config['WORKER_THREADS']
+    limiter = AIMDLimiter(
+        threads,
+        min(app.config['CONCURRENCY_MIN_LIMIT'], threads),
+        threads,
+        app.config['CONCURRENCY_TARGET_LATENCY']
+    )
+    app.extensions['concurrency_limiter'] = limiter
+    max_queue_delay = app.config['CONCURRENCY_MAX_QUEUE_DELAY']
+    trust_request_start = app.config['CONCURRENCY_TRUST_REQUEST_START']
+    
+    wsgi_app = app.wsgi_app
+    
+    def stamp_arrival(environ, start_response):
+        now = time.time()
+        arrived_at = request_start(environ) if trust_request_start else None
+        # Never trust a timestamp from the future
+        environ['backend.arrived_at'] = min(arrived_at, now) if arrived_at else now
+        return wsgi_app(environ, start_response)
+    
+    app.wsgi_app = stamp_arrival
+    
+    @app.before_request
+    def admit_request():
+        # Preflights are trivial, and batch sub-requests run in their batch's slot
+        if request.method == 'OPTIONS' or request.environ.get('backend.sub_request'):
+            return None
+        
+        priority_class = request_priority()
+        queued = time.time() - request.environ.get('backend.arrived_at', time.time())
+        queued_too_long = (
+            priority_class != PRIORITY_CRITICAL
+            and queued > max_queue_delay * PRIORITY_SHARES[priority_class]
+        )
+        if queued_too_long or not limiter.try_acquire(priority_class):
+            response = jsonify({
+                'success': False,
+                'message': 'Server is overloaded, please retry',
+                'error': 'overloaded'
+            })
+            response.status_code = 503
+            response.headers['Retry-After'] = str(app.config['CONCURRENCY_RETRY_AFTER'])
+            return response
+        
+        request.environ['backend.admitted'] = True
+        return None
+    
+    @app.teardown_request
+    def release_request(error=None):
+        if request.environ.pop('backend.admitted', False):
+            limiter.release(time.time() - request.environ['backend.arrived_at'])
+    
+    return limiter
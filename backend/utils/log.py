@@ -0,0 +1,210 @@
+import os
+import sys
+import atexit
+import json
+import time
+import uuid
+import queue
+import random
+import logging
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from flask import request, has_request_context
+from flask.logging import default_handler
+
+# Attributes every LogRecord has, anything else was passed through `extra`
+RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including any `extra` fields"""
+    
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRS and key != 'sample':
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class RequestContextFilter(logging.Filter):
+    """Attach the request id, method and path to records logged during a request"""
+    
+    def filter(self, record):
+        if has_request_context():
+            record.request_id = request.environ.get('backend.request_id')
+            record.method = request.method
+            record.path = request.path
+        return True
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of high-volume INFO records, marked with extra={'sample': True}.
+    Warnings and errors are never sampled.
+    """
+    
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record):
+        if record.levelno == logging.INFO and getattr(record, 'sample', False):
+            return random.random() < self.rate
+        return True
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Hand records to a bounded queue without ever blocking the caller.
+    Records that do not fit are dropped and counted.
+    """
+    
+    def __init__(self, queue_):
+        super().__init__(queue_)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+    
+    def prepare(self, record):
+        # The queue never leaves the process, so the message is formatted
+        # lazily on the listener thread rather than here on the request thread
+        return record
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+class DropReportingListener(QueueListener):
+    """QueueListener that logs how many records were dropped since it last reported"""
+    
+    def __init__(self, queue_handler, *handlers):
+        super().__init__(queue_handler.queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+        self.reported = 0
+    
+    def enqueue_sentinel(self):
+        # Block until there is room rather than failing to stop when the queue is full
+        self.queue.put(self._sentinel)
+    
+    def handle(self, record):
+        super().handle(record)
+        dropped = self.queue_handler.dropped
+        if dropped > self.reported:
+            super().handle(logging.makeLogRecord({
+                'name': __name__,
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': 'Log queue full, dropped %d records',
+                'args': (dropped - self.reported,),
+                'dropped_total': dropped
+            }))
+            self.reported = dropped
+
+class LogPipeline:
+    """
+    Queue-based logging: request threads only enqueue records, and a listener
+    thread formats them as JSON and writes them to the output stream.
+    """
+    
+    def __init__(self, max_size, sample_rate, stream=None):
+        self.max_size = max_size
+        self.output = logging.StreamHandler(stream or sys.stdout)
+        self.output.setFormatter(JsonFormatter())
+        
+        self.handler = DroppingQueueHandler(queue.Queue(max_size))
+        self.handler.pipeline = self
+        self.handler.addFilter(SamplingFilter(sample_rate))
+        self.handler.addFilter(RequestContextFilter())
+        self.listener = DropReportingListener(self.handler, self.output)
+        self.running = False
+    
+    @property
+    def dropped(self):
+        return self.handler.dropped
+    
+    def start(self):
+        self.listener.start()
+        self.running = True
+        running_pipelines.add(self)
+    
+    def stop(self):
+        if self.running:
+            self.running = False
+            running_pipelines.discard(self)
+            self.listener.stop()
+    
+    def _restart_in_child(self):
+        self.handler.queue = queue.Queue(self.max_size)
+        self.listener = DropReportingListener(self.handler, self.output)
+        self.listener.start()
+
+# Pipelines whose listener is running. The process hooks below are registered
+# once and act on whichever pipelines are running when they fire, however many
+# times the app is created.
+running_pipelines = set()
+
+def stop_running_pipelines():
+    """Flush what is queued when the process exits"""
+    for pipeline in list(running_pipelines):
+        pipeline.stop()
+
+def restart_pipelines_in_child():
+    """Threads do not survive fork, so preforked workers need their own listeners"""
+    for pipeline in list(running_pipelines):
+        pipeline._restart_in_child()
+
+atexit.register(stop_running_pipelines)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=restart_pipelines_in_child)
+
+def log_requests(app):
+    """Assign each request an id and log its status and duration"""
+    
+    @app.before_request
+    def start_request_timer():
+        # Stored in the environ rather than g, which batch sub-requests share
+        request.environ['backend.request_id'] = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+        request.environ['backend.request_start'] = time.perf_counter()
+    
+    @app.after_request
+    def log_request(response):
+        request_id = request.environ.get('backend.request_id')
+        start = request.environ.get('backend.request_start')
+        if request_id is None:
+            return response
+        
+        response.headers['X-Request-ID'] = request_id
+        app.logger.info(
+            "%s %s %s", request.method, request.path, response.status_code,
+            extra={
+                'sample': True,
+                'status': response.status_code,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 2)
+            }
+        )
+        return response
+
+def configure_logging(app):
+    """Route the application logger through a LogPipeline"""
+    for handler in list(app.logger.handlers):
+        if isinstance(handler, DroppingQueueHandler):
+            handler.pipeline.stop()
+            app.logger.removeHandler(handler)
+    # Flask's default handler writes to the request's error stream synchronously
+    app.logger.removeHandler(default_handler)
+    
+    pipeline = LogPipeline(app.config['LOG_QUEUE_SIZE'], app.config['LOG_SAMPLE_RATE'])
+    app.logger.addHandler(pipeline.handler)
+    app.logger.setLevel(logging.INFO)
+    pipeline.start()
+    
+    app.extensions['log_pipeline'] = pipeline
+    log_requests(app)
+    return pipeline
@@ -1,9 +1,11 @@
 import re
 from datetime import datetime
-from email_validator import validate_email as validate_email_lib, EmailNotValidError
 
 def validate_email(email):
     """Validate email format"""
+    # email_validator pulls in dnspython, so it is only imported once an email needs checking
+    from email_validator import validate_email as validate_email_lib, EmailNotValidError
+    
     # Special cases for localhost and IP addresses
     if '@' in email:
         local_part, domain = email.rsplit('@', 1)
@@ -71,4 +73,39 @@ def validate_project_data(data):
     elif len(data.get('name', '')) > 100:
         errors['name'] = "Name must be less than 100 characters"
     
-    return len(errors) == 0, errors
\ No newline at end of file
+    return len(errors) == 0, errors
+
+def validate_job_data(data):
+    """Validate job data"""
+    errors = {}
+    
+    # Type must be one of the job handlers
+    job_type = data.get('type')
+    if job_type not in ['delete_tasks', 'delete_project', 'export_tasks']:
+        errors['type'] = "Type must be one of: delete_tasks, delete_project, export_tasks"
+    
+    params = data.get('params', {})
+    if not isinstance(params, dict):
+        errors['params'] = "Params must be an object"
+        return False, errors
+    
+    if job_type == 'delete_tasks':
+        # Require a filter so a job never deletes every task by accident
+        if not params.get('status') and not params.get('ids'):
+            errors['params'] = "Status or ids is required"
+        elif params.get('status') and params['status'] not in ['todo', 'in-progress', 'completed']:
+            errors['params'] = "Status must be one of: todo, in-progress, completed"
+        elif params.get('ids') and not (
+                isinstance(params['ids'], list) and all(isinstance(id_, int) for id_ in params['ids'])):
+            errors['params'] = "Ids must be a list of integers"
+    
+    if job_type == 'delete_project' and not isinstance(params.get('project_id'), int):
+        errors['params'] = "Project id is required"
+    
+    if job_type == 'export_tasks' and params.get('due_date'):
+        try:
+            datetime.fromisoformat(str(params['due_date']).replace('Z', '+00:00'))
+        except ValueError:
+            errors['params'] = "Due date must be a valid ISO format date"
+    
+    return len(errors) == 0, errors
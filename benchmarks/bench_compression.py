@@ -0,0 +1,76 @@
+"""
+Compression benchmark for API responses, comparing bytes sent against CPU
+time per response for each gzip level and brotli quality.
+
+The payload is a task list serialized exactly as GET /api/tasks returns it.
+Use the results to choose COMPRESS_LEVEL and COMPRESS_BROTLI_QUALITY.
+
+Usage:
+    python benchmarks/bench_compression.py --tasks 500
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.models.task import Task
+
+def task_list_payload(count):
+    """A GET /api/tasks response body with `count` realistic tasks"""
+    start = datetime(2024, 1, 1, 9, 30)
+    tasks = [
+        Task(
+            id=index + 1,
+            title=f'Follow up on item {index}',
+            description='Review the notes and send a summary to the team' if index % 3 else '',
+            due_date=start + timedelta(days=index % 30) if index % 4 else None,
+            priority=('high', 'medium', 'low')[index % 3],
+            status=('todo', 'in-progress', 'completed')[index % 3],
+            created_at=start + timedelta(minutes=index),
+            updated_at=start + timedelta(minutes=index, seconds=17),
+            user_id=1,
+            project_id=index % 5 or None
+        ).to_dict()
+        for index in range(count)
+    ]
+    body = {'success': True, 'data': tasks, 'message': 'Tasks retrieved successfully'}
+    # Same encoding as jsonify() outside debug mode
+    return json.dumps(body, separators=(',', ':'), sort_keys=True).encode()
+
+def measure(name, level, compress, data, repeat):
+    seconds = min(timeit.repeat(lambda: compress(data), number=1, repeat=repeat))
+    size = len(compress(data))
+    print(f"{name:<8} {level:>5} {size:>10} {len(data) / size:>7.1f}x {seconds * 1000:>9.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    data = task_list_payload(args.tasks)
+    print(f"payload: {args.tasks} tasks, {len(data)} bytes\n")
+    print(f"{'encoding':<8} {'level':>5} {'bytes':>10} {'ratio':>8} {'time':>12}")
+
+    for level in range(1, 10):
+        measure('gzip', level, lambda d: gzip.compress(d, compresslevel=level), data, args.repeat)
+
+    if brotli is None:
+        print("\nbrotli is not installed, skipping")
+        return
+
+    for quality in range(0, 12):
+        measure('br', quality, lambda d: brotli.compress(d, quality=quality), data, args.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Concurrency benchmark for comparing the gunicorn and uvicorn deployments.
+
+Opens many concurrent keep-alive connections against a running server and
+reports how many connections were served along with throughput and latency
+percentiles for authenticated task list reads. Requests shed by the concurrency
+limiter are counted separately.
+
+Rate limiting must be disabled on the server since all clients share one IP.
+
+Usage:
+    export RATELIMIT_ENABLED=0
+    gunicorn -w 4 -b 127.0.0.1:8000 run:app
+    uvicorn --port 8001 asgi:app
+
+    python benchmarks/bench_concurrency.py --port 8000 --clients 1000
+    python benchmarks/bench_concurrency.py --port 8001 --clients 1000
+"""
+import argparse
+import asyncio
+import json
+import time
+import urllib.request
+
+def get_token(host, port, email, password):
+    """Register the benchmark user (or log in if it exists) and return an access token"""
+    base = f'http://{host}:{port}/api/auth'
+    for path, payload in (
+        ('/register', {'name': 'Benchmark', 'email': email, 'password': password}),
+        ('/login', {'email': email, 'password': password})
+    ):
+        request = urllib.request.Request(
+            base + path,
+            data=json.dumps(payload).encode(),
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return json.loads(response.read())['data']['access_token']
+        except urllib.error.HTTPError as e:
+            if e.code != 409:
+                raise
+    raise RuntimeError("Could not obtain an access token")
+
+async def read_response(reader):
+    """Read one HTTP/1.1 response and return its status code and whether the connection stays open"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Connection closed by server")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip().lower()
+    if headers.get('transfer-encoding') == 'chunked':
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get('content-length', 0)))
+    return int(status_line.split()[1]), headers.get('connection') != 'close'
+
+async def connect(args, stats):
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(args.host, args.port), timeout=args.timeout
+    )
+    stats['connections'] += 1
+    return reader, writer
+
+async def client(args, request_bytes, deadline, stats):
+    try:
+        reader, writer = await connect(args, stats)
+    except (OSError, asyncio.TimeoutError):
+        stats['connect_errors'] += 1
+        return
+    try:
+        while time.monotonic() < deadline:
+            start = time.monotonic()
+            writer.write(request_bytes)
+            status, keep_alive = await asyncio.wait_for(read_response(reader), timeout=args.timeout)
+            # Throughput and latency only count served requests, shed ones return at once
+            if status == 200:
+                stats['latencies'].append(time.monotonic() - start)
+            elif status == 503:
+                stats['shed'] += 1
+            else:
+                stats['errors'] += 1
+            if not keep_alive:
+                # Sync workers close the connection after every response
+                writer.close()
+                reader, writer = await connect(args, stats)
+    except (OSError, ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+        stats['errors'] += 1
+    finally:
+        writer.close()
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+async def run(args, token):
+    request_bytes = (
+        f'GET {args.path} HTTP/1.1\r\n'
+        f'Host: {args.host}:{args.port}\r\n'
+        f'Authorization: Bearer {token}\r\n'
+        'Connection: keep-alive\r\n\r\n'
+    ).encode()
+    stats = {'connections': 0, 'connect_errors': 0, 'errors': 0, 'shed': 0, 'latencies': []}
+    deadline = time.monotonic() + args.duration
+    await asyncio.gather(*(client(args, request_bytes, deadline, stats) for _ in range(args.clients)))
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--path', default='/api/tasks')
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--duration', type=float, default=30.0)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--email', default='benchmark@example.com')
+    parser.add_argument('--password', default='Benchmark1')
+    args = parser.parse_args()
+
+    token = get_token(args.host, args.port, args.email, args.password)
+    stats = asyncio.run(run(args, token))
+    latencies = stats['latencies']
+
+    print(f"clients:          {args.clients}")
+    print(f"connections:      {stats['connections']} opened ({stats['connect_errors']} failed)")
+    print(f"served:           {len(latencies)} ({stats['shed']} shed with 503, {stats['errors']} errors)")
+    print(f"throughput:       {len(latencies) / args.duration:.1f} req/s")
+    print(f"latency p50:      {percentile(latencies, 0.50) * 1000:.1f} ms")
+    print(f"latency p99:      {percentile(latencies, 0.99) * 1000:.1f} ms")
+
+if __name__ == '__main__':
+    main()
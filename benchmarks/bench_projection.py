@@ -0,0 +1,105 @@
+"""
+Serialization benchmark for the task and project list routes, comparing rows
+serialized per second by the ORM path (instances + to_dict()) against the
+read-only projection path (column tuples + row_to_dict).
+
+Both paths read the same seeded SQLite database inside one app context.
+
+Usage:
+    python benchmarks/bench_projection.py --tasks 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.app import create_app
+from backend.models.user import db
+from backend.models.task import Task
+from backend.models.project import Project
+from backend.projections import (
+    task_list_query, task_row_to_dict, project_list_statement, project_row_to_dict
+)
+
+def seed(task_count, project_count):
+    start = datetime(2024, 1, 1, 9, 30)
+    db.session.execute(Project.__table__.insert(), [
+        {'name': f'Project {index}', 'description': 'Planning', 'user_id': 1,
+         'created_at': start, 'updated_at': start}
+        for index in range(project_count)
+    ])
+    db.session.execute(Task.__table__.insert(), [
+        {
+            'title': f'Follow up on item {index}',
+            'description': 'Review the notes and send a summary to the team' if index % 3 else '',
+            'due_date': start + timedelta(days=index % 30) if index % 4 else None,
+            'priority': ('high', 'medium', 'low')[index % 3],
+            'status': ('todo', 'in-progress', 'completed')[index % 3],
+            'created_at': start + timedelta(minutes=index),
+            'updated_at': start + timedelta(minutes=index, seconds=17),
+            'user_id': 1,
+            'project_id': index % project_count + 1 if index % 5 else None
+        }
+        for index in range(task_count)
+    ])
+    db.session.commit()
+
+def orm_tasks():
+    tasks = [task.to_dict() for task in Task.query.filter(Task.user_id == 1).all()]
+    db.session.remove()
+    return tasks
+
+def projected_tasks():
+    statement, params = task_list_query(1, {})
+    tasks = [task_row_to_dict(row) for row in db.session.execute(statement, params)]
+    db.session.remove()
+    return tasks
+
+def orm_projects():
+    projects = [project.to_dict() for project in Project.query.filter_by(user_id=1).all()]
+    db.session.remove()
+    return projects
+
+def projected_projects():
+    rows = db.session.execute(project_list_statement(), {'user_id': 1})
+    projects = [project_row_to_dict(row) for row in rows]
+    db.session.remove()
+    return projects
+
+def measure(name, fn, repeat):
+    rows = len(fn())
+    seconds = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print(f"{name:<20} {rows:>7} {seconds * 1000:>9.2f} ms {rows / seconds:>12,.0f} rows/s")
+    return seconds
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=2000)
+    parser.add_argument('--projects', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app('testing', {
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            'RATELIMIT_ENABLED': False
+        })
+
+        with app.app_context():
+            seed(args.tasks, args.projects)
+            print(f"{'path':<20} {'rows':>7} {'time':>12} {'throughput':>17}")
+
+            orm = measure('tasks orm', orm_tasks, args.repeat)
+            fast = measure('tasks projection', projected_tasks, args.repeat)
+            print(f"{'':<20} {orm / fast:>7.1f}x faster\n")
+
+            orm = measure('projects orm', orm_projects, args.repeat)
+            fast = measure('projects projection', projected_projects, args.repeat)
+            print(f"{'':<20} {orm / fast:>7.1f}x faster")
+
+if __name__ == '__main__':
+    main()
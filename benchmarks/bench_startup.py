@@ -0,0 +1,59 @@
+"""
+Startup benchmark measuring how long a fresh worker process takes to import
+the application, build it with create_app() and serve its first request.
+
+Each sample runs in a new interpreter against an already migrated database,
+as a worker started by gunicorn would.
+
+Usage:
+    python migrate.py
+    python benchmarks/bench_startup.py --runs 20
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = '''
+import json, time
+start = time.perf_counter()
+from backend.app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+response = app.test_client().get('/')
+served = time.perf_counter()
+assert response.status_code == 200
+print(json.dumps({
+    'import': imported - start,
+    'create_app': created - imported,
+    'first_request': served - created,
+    'total': served - start
+}))
+'''
+
+def sample():
+    result = subprocess.run(
+        [sys.executable, '-c', SAMPLE],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.runs)]
+    for phase in ('import', 'create_app', 'first_request', 'total'):
+        values = [s[phase] * 1000 for s in samples]
+        print(f"{phase:<15} median {statistics.median(values):7.1f} ms   min {min(values):7.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,48 @@
 const esbuild = require('esbuild');
-const { copy } = require('esbuild-plugin-copy');
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+// Production build served by Flask: content-hashed assets in dist/assets with
+// precompressed .br and .gz variants, and an index.html pointing at them.
+const distDir = path.join(__dirname, '..', 'dist');
+const assetsDir = path.join(distDir, 'assets');
+
+// Copy a file into the assets directory under a content-hashed name
+const copyHashed = (file) => {
+  const content = fs.readFileSync(file);
+  const hash = crypto.createHash('sha256').update(content).digest('hex').slice(0, 8).toUpperCase();
+  const { name, ext } = path.parse(file);
+  const hashedName = `${name}-${hash}${ext}`;
+  fs.writeFileSync(path.join(assetsDir, hashedName), content);
+  return hashedName;
+};
+
+// Write maximum-compression variants next to every asset, they are only built once
+const precompress = () => {
+  for (const file of fs.readdirSync(assetsDir)) {
+    if (file.endsWith('.br') || file.endsWith('.gz')) continue;
+    const filePath = path.join(assetsDir, file);
+    const content = fs.readFileSync(filePath);
+    fs.writeFileSync(`${filePath}.gz`, zlib.gzipSync(content, { level: zlib.constants.Z_BEST_COMPRESSION }));
+    fs.writeFileSync(`${filePath}.br`, zlib.brotliCompressSync(content, {
+      params: { [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY }
+    }));
+  }
+};
+
+fs.rmSync(distDir, { recursive: true, force: true });
 
 esbuild.build({
   entryPoints: ['src/index.js'],
   bundle: true,
   minify: true,
   sourcemap: true,
-  outfile: 'public/bundle.js',
+  outdir: assetsDir,
+  entryNames: '[name]-[hash]',
+  assetNames: '[name]-[hash]',
+  metafile: true,
   loader: { 
     '.js': 'jsx',
     '.png': 'file',
@@ -17,12 +53,15 @@ esbuild.build({
     'process.env.NODE_ENV': '"production"',
     'process.env.REACT_APP_API_URL': '"http://localhost:5000"'
   },
-  plugins: [
-    copy({
-      assets: {
-        from: ['public/*'],
-        to: ['../dist'],
-      },
-    }),
-  ],
-}).catch(() => process.exit(1));
\ No newline at end of file
+}).then((result) => {
+  const bundle = Object.keys(result.metafile.outputs)
+    .find((output) => result.metafile.outputs[output].entryPoint === 'src/index.js');
+  const styles = copyHashed(path.join(__dirname, 'public', 'styles.css'));
+  
+  const html = fs.readFileSync(path.join(__dirname, 'public', 'index.html'), 'utf8')
+    .replace('/bundle.js', `/assets/${path.basename(bundle)}`)
+    .replace('/styles.css', `/assets/${styles}`);
+  fs.writeFileSync(path.join(distDir, 'index.html'), html);
+  
+  precompress();
+}).catch(() => process.exit(1));
@@ -9,6 +9,10 @@ const Dashboard = () => {
     completed: 0,
     total: 0
   });
+  const [dueStats, setDueStats] = useState({
+    overdue: 0,
+    due_this_week: 0
+  });
   const [recentTasks, setRecentTasks] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
@@ -16,18 +20,16 @@ const Dashboard = () => {
   useEffect(() => {
     const fetchDashboardData = async () => {
       try {
-        // Fetch task statistics
-        const statsResponse = await api.get('/api/tasks/status-counts');
-        
-        if (statsResponse.data.success) {
-          setTaskStats(statsResponse.data.data);
-        }
-        
-        // Fetch recent tasks
-        const tasksResponse = await api.get('/api/tasks?limit=5');
+        // Fetch task statistics and the most urgent tasks in one request
+        const response = await api.get('/api/dashboard?limit=5');
         
-        if (tasksResponse.data.success) {
-          setRecentTasks(tasksResponse.data.data);
+        if (response.data.success) {
+          setTaskStats(response.data.data.status_counts);
+          setDueStats({
+            overdue: response.data.data.overdue,
+            due_this_week: response.data.data.due_this_week
+          });
+          setRecentTasks(response.data.data.urgent_tasks);
         }
         
         setLoading(false);
@@ -108,12 +110,15 @@ const Dashboard = () => {
         <div className="col-md-6 mb-4">
           <div className="card h-100">
             <div className="card-header d-flex justify-content-between align-items-center">
-              <h5 className="mb-0">Recent Tasks</h5>
+              <h5 className="mb-0">Most Urgent Tasks</h5>
               <Link to="/tasks" className="btn btn-sm btn-outline-primary">
                 View All
               </Link>
             </div>
             <div className="card-body">
+              <p className="text-muted small">
+                {dueStats.overdue} overdue, {dueStats.due_this_week} due this week
+              </p>
               {recentTasks.length > 0 ? (
                 <ul className="list-group list-group-flush">
                   {recentTasks.map(task => (
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link, useLocation, useNavigate } from 'react-router-dom';
-import api from '../../utils/api';
+import api, { batch } from '../../utils/api';
 
 const TaskList = () => {
   const [tasks, setTasks] = useState([]);
@@ -47,18 +47,18 @@ const TaskList = () => {
         if (filters.project_id) queryParams.append('project_id', filters.project_id);
         if (filters.search) queryParams.append('search', filters.search);
         
-        // Fetch tasks with filters
-        const tasksResponse = await api.get(`/api/tasks?${queryParams.toString()}`);
+        // Fetch tasks with filters and projects for filter dropdown together
+        const [tasksResult, projectsResult] = await batch([
+          { method: 'GET', path: `/api/tasks?${queryParams.toString()}` },
+          { method: 'GET', path: '/api/projects' }
+        ], { parallel: true });
         
-        if (tasksResponse.data.success) {
-          setTasks(tasksResponse.data.data);
+        if (tasksResult.body?.success) {
+          setTasks(tasksResult.body.data);
         }
         
-        // Fetch projects for filter dropdown
-        const projectsResponse = await api.get('/api/projects');
-        
-        if (projectsResponse.data.success) {
-          setProjects(projectsResponse.data.data);
+        if (projectsResult.body?.success) {
+          setProjects(projectsResult.body.data);
         }
         
         setLoading(false);
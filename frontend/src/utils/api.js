@@ -80,4 +80,11 @@ api.interceptors.response.use(
   }
 );
 
+// Send several API requests in one round-trip. Resolves to a list of
+// { status, body } results in the same order as the requests.
+export const batch = async (requests, { parallel = false } = {}) => {
+  const response = await api.post('/api/batch', { requests, parallel });
+  return response.data.data;
+};
+
 export default api;
\ No newline at end of file
@@ -0,0 +1,13 @@
+# Gunicorn settings, picked up automatically by `gunicorn run:app`
+from backend.config import Config
+
+# Import and build the app once in the master so forked workers start serving
+# immediately. create_app() leaves no open database connections behind, so
+# workers are safe to fork from it.
+preload_app = True
+
+# Serve requests on threads so each worker's adaptive concurrency limiter sees
+# its real in-flight load and can shed the excess with a 503. Put a proxy
+# setting X-Request-Start in front so the limiter also sees time spent queued
+# for a thread.
+threads = Config.WORKER_THREADS
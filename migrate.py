@@ -0,0 +1,10 @@
+import os
+
+# Create or upgrade the database schema. Run this once per deploy, before
+# starting or scaling out workers, so they only need the boot-time version check.
+os.environ['AUTO_MIGRATE'] = '1'
+
+from backend.app import create_app
+
+if __name__ == '__main__':
+    create_app()
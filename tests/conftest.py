@@ -0,0 +1,71 @@
+import sys
+import os
+
+import pytest
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.app import create_app
+from backend.models.user import db, User
+from sql_budget import SqlRecorder, seed_user_data
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / 'test.db'
+
+@pytest.fixture
+def app_factory(db_path):
+    """Create applications with config overrides, all backed by the test's SQLite database file"""
+    def make_app(**config):
+        config_overrides = {
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
+            'RATELIMIT_ENABLED': False
+        }
+        config_overrides.update(config)
+        return create_app('testing', config_overrides)
+    return make_app
+
+@pytest.fixture
+def app(app_factory):
+    return app_factory()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def auth_headers(client):
+    response = client.post('/api/auth/register', json={
+        'name': 'Test User',
+        'email': 'test@example.com',
+        'password': 'Password1'
+    })
+    return {'Authorization': f"Bearer {response.get_json()['data']['access_token']}"}
+
+@pytest.fixture
+def seeded_tokens(app, client):
+    """Register the test user, seed both users' data and return the test user's tokens"""
+    tokens = client.post('/api/auth/register', json={
+        'name': 'Test User',
+        'email': 'test@example.com',
+        'password': 'Password1'
+    }).get_json()['data']
+    
+    with app.app_context():
+        other = User('Other User', 'other@example.com', 'Password1')
+        db.session.add(other)
+        db.session.commit()
+        seed_user_data(tokens['user']['id'])
+        seed_user_data(other.id)
+    
+    return tokens
+
+@pytest.fixture
+def sql_recorder(app):
+    with app.app_context():
+        engine = db.engine
+    
+    recorder = SqlRecorder(engine)
+    yield recorder
+    recorder.close()
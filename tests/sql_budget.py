@@ -0,0 +1,134 @@
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from backend.models.user import db
+from backend.models.task import Task
+from backend.models.project import Project
+from backend.models.job import Job
+
+# EXPLAIN QUERY PLAN reports a full pass over a table as "SCAN <table>", or
+# "SCAN TABLE <table>" on SQLite before 3.36
+FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)')
+
+@dataclass
+class Budget:
+    """The SQL an endpoint may run for one request"""
+    method: str
+    path: str
+    statements: int
+    rows: int = 0
+    body: dict = None
+    token: str = 'access'
+
+@dataclass
+class Statement:
+    sql: str
+    parameters: object
+    plan: list
+    rows: int = 0
+
+@dataclass
+class Recording:
+    statements: list = field(default_factory=list)
+
+    @property
+    def rows(self):
+        return sum(statement.rows for statement in self.statements)
+
+    def full_scans(self, tables):
+        """(table, sql) for every statement that reads a whole table"""
+        scans = []
+        for statement in self.statements:
+            for detail in statement.plan:
+                match = FULL_SCAN.match(detail)
+                if match and match.group(1) in tables:
+                    scans.append((match.group(1), statement.sql))
+        return scans
+
+    def check(self, budget, tables):
+        """Assert the recorded SQL stays within `budget`"""
+        sql = '\n'.join(statement.sql for statement in self.statements)
+        assert len(self.statements) <= budget.statements, (
+            f"{budget.method} {budget.path} ran {len(self.statements)} statements, "
+            f"budget is {budget.statements}:\n{sql}"
+        )
+        assert not self.full_scans(tables), (
+            f"{budget.method} {budget.path} scans whole tables: {self.full_scans(tables)}"
+        )
+        assert self.rows <= budget.rows, (
+            f"{budget.method} {budget.path} read {self.rows} rows, budget is {budget.rows}:\n{sql}"
+        )
+
+class SqlRecorder:
+    """
+    Records every statement an engine runs while a recording is open, with
+    its query plan and, for SELECTs, the number of rows it returns. Both are
+    taken on the statement's own connection just before it runs, so they see
+    the same data as the statement itself.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.recording = None
+        event.listen(engine, 'before_cursor_execute', self.before_cursor_execute)
+
+    def close(self):
+        event.remove(self.engine, 'before_cursor_execute', self.before_cursor_execute)
+
+    @contextmanager
+    def record(self):
+        self.recording = Recording()
+        try:
+            yield self.recording
+        finally:
+            self.recording = None
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.recording is None:
+            return
+        
+        connection = cursor.connection
+        if executemany:
+            parameters = parameters[0]
+        
+        plan = [row[3] for row in connection.execute(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+        recorded = Statement(statement, parameters, plan)
+        if statement.lstrip().upper().startswith('SELECT'):
+            recorded.rows = connection.execute(f'SELECT count(*) FROM ({statement})', parameters).fetchone()[0]
+        
+        self.recording.statements.append(recorded)
+
+# Seeded database for the SQL budget tests: the test user owns
+# SEEDED_PROJECTS projects, SEEDED_TASKS tasks spread over them and one
+# finished export job. A second user owns as much again, so a query missing
+# its user filter shows up in the rows read
+SEEDED_PROJECTS = 5
+SEEDED_TASKS = 100
+
+def seed_user_data(user_id):
+    now = datetime.utcnow()
+    db.session.execute(Project.__table__.insert(), [
+        {'name': f'Project {index}', 'user_id': user_id, 'created_at': now, 'updated_at': now}
+        for index in range(SEEDED_PROJECTS)
+    ])
+    project_ids = [row.id for row in Project.query.filter_by(user_id=user_id)]
+    db.session.execute(Task.__table__.insert(), [
+        {
+            'title': f'Task {index}',
+            'description': '',
+            'due_date': now + timedelta(days=index - SEEDED_TASKS // 2) if index % 4 else None,
+            'priority': ('high', 'medium', 'low')[index % 3],
+            'status': ('todo', 'in-progress', 'completed')[index % 3],
+            'created_at': now,
+            'updated_at': now,
+            'user_id': user_id,
+            'project_id': project_ids[index % SEEDED_PROJECTS] if index % 2 else None
+        }
+        for index in range(SEEDED_TASKS)
+    ])
+    db.session.add(Job(type='export_tasks', status='completed', progress=100, user_id=user_id))
+    db.session.commit()
@@ -0,0 +1,83 @@
+from flask_jwt_extended import JWTManager
+
+def test_batch_dispatches_in_order(client, auth_headers):
+    response = client.post('/api/batch', json={'requests': [
+        {'method': 'POST', 'path': '/api/projects', 'body': {'name': 'Work'}},
+        {'method': 'POST', 'path': '/api/tasks', 'body': {'title': 'Plan', 'priority': 'high'}},
+        {'path': '/api/tasks', 'query': {'priority': 'high'}},
+        {'path': '/api/projects'},
+        {'path': '/api/tasks/404'},
+        {'method': 'POST', 'path': '/api/tasks', 'body': {}}
+    ]}, headers=auth_headers)
+    
+    assert response.status_code == 200
+    results = response.get_json()['data']
+    assert [result['status'] for result in results] == [201, 201, 200, 200, 404, 400]
+    assert [task['title'] for task in results[2]['body']['data']] == ['Plan']
+    assert [project['name'] for project in results[3]['body']['data']] == ['Work']
+
+def test_batch_parallel_reads_match_direct_requests(client, auth_headers):
+    client.post('/api/tasks', json={'title': 'Plan'}, headers=auth_headers)
+    paths = ['/api/tasks', '/api/projects', '/api/auth/profile', '/api/dashboard']
+    
+    response = client.post('/api/batch', json={
+        'requests': [{'path': path} for path in paths],
+        'parallel': True
+    }, headers=auth_headers)
+    
+    results = response.get_json()['data']
+    for path, result in zip(paths, results):
+        assert result['body'] == client.get(path, headers=auth_headers).get_json()
+
+def test_batch_requires_authentication(client):
+    response = client.post('/api/batch', json={'requests': [{'path': '/api/tasks'}]})
+    assert response.status_code == 401
+
+def test_batch_rejects_invalid_requests(client, auth_headers):
+    for data in [
+        {'requests': []},
+        {'requests': [{'path': '/api/tasks'}] * 21},
+        {'requests': [{'path': '/api/batch', 'method': 'POST'}]},
+        {'requests': [{'path': '/api/%62atch', 'method': 'POST', 'body': {'requests': [{'path': '/api/tasks'}]}}]},
+        {'requests': [{'path': 'http://example.com/'}]},
+        {'requests': [{'path': '/api/tasks', 'method': 'PATCH'}]},
+        {'requests': [{'path': '/api/tasks', 'method': 1}]},
+        {'requests': [{'path': ['/api/tasks']}]},
+        {'requests': [{'path': '/api/tasks', 'query': 5}]},
+        {'requests': ['/api/tasks']}
+    ]:
+        assert client.post('/api/batch', json=data, headers=auth_headers).status_code == 400
+
+def test_batch_decodes_jwt_once(client, auth_headers, monkeypatch):
+    decoded = []
+    decode = JWTManager._decode_jwt_from_config
+    
+    def counting_decode(self, *args, **kwargs):
+        decoded.append(args[0])
+        return decode(self, *args, **kwargs)
+    monkeypatch.setattr(JWTManager, '_decode_jwt_from_config', counting_decode)
+    
+    response = client.post('/api/batch', json={'requests': [
+        {'path': '/api/tasks'},
+        {'path': '/api/projects'},
+        {'path': '/api/tasks/status-counts'}
+    ]}, headers=auth_headers)
+    
+    assert [result['status'] for result in response.get_json()['data']] == [200, 200, 200]
+    assert len(decoded) == 1
+
+def test_batch_sub_requests_are_rate_limited_per_client(app_factory, auth_headers):
+    client = app_factory(RATELIMIT_ENABLED=True).test_client()
+    batch = {'requests': [{'path': '/api/tasks'}] * 20}
+    
+    def statuses(remote_addr, data):
+        response = client.post('/api/batch', json=data, headers=auth_headers,
+                               environ_base={'REMOTE_ADDR': remote_addr})
+        return [result['status'] for result in response.get_json()['data']]
+    
+    # 100 sub-requests use up the first client's 100 per minute for the route
+    for _ in range(5):
+        assert statuses('10.0.0.1', batch) == [200] * 20
+    one = {'requests': [{'path': '/api/tasks'}]}
+    assert statuses('10.0.0.1', one) == [429]
+    assert statuses('10.0.0.2', one) == [200]
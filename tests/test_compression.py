@@ -0,0 +1,52 @@
+import gzip
+
+import pytest
+
+
+def test_large_responses_are_gzipped(client, auth_headers):
+    for index in range(30):
+        client.post('/api/tasks', json={'title': f'Task {index}'}, headers=auth_headers)
+    
+    plain = client.get('/api/tasks', headers=auth_headers)
+    compressed = client.get('/api/tasks', headers={**auth_headers, 'Accept-Encoding': 'gzip'})
+    
+    assert 'Content-Encoding' not in plain.headers
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert compressed.headers['Vary'] == 'Accept-Encoding'
+    assert int(compressed.headers['Content-Length']) < len(plain.get_data())
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+
+def test_brotli_preferred_when_available(app_factory):
+    brotli = pytest.importorskip('brotli')
+    client = app_factory(COMPRESS_MIN_SIZE=0).test_client()
+    
+    response = client.get('/', headers={'Accept-Encoding': 'gzip, br'})
+    assert response.headers['Content-Encoding'] == 'br'
+    assert b'Task Management API' in brotli.decompress(response.get_data())
+
+def test_precompressed_assets(app_factory, tmp_path):
+    dist = tmp_path / 'dist'
+    (dist / 'assets').mkdir(parents=True)
+    (dist / 'index.html').write_text('<script src="/assets/index-ABC123.js"></script>')
+    content = b'console.log("task manager");' * 100
+    (dist / 'assets' / 'index-ABC123.js').write_bytes(content)
+    (dist / 'assets' / 'index-ABC123.js.gz').write_bytes(gzip.compress(content))
+    
+    client = app_factory(FRONTEND_DIST=str(dist)).test_client()
+    
+    response = client.get('/assets/index-ABC123.js', headers={'Accept-Encoding': 'gzip, br'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert gzip.decompress(response.get_data()) == content
+    
+    response = client.get('/assets/index-ABC123.js')
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_data() == content
+    
+    assert client.get('/assets/missing.js').status_code == 404
+    assert client.get('/tasks/new').headers['Cache-Control'] == 'no-cache'
+    assert client.get('/api/missing').get_json()['error'] == 404
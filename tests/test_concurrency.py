@@ -0,0 +1,161 @@
+import http.client
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler
+from backend.utils.concurrency import (
+    AIMDLimiter, request_priority, request_start, PRIORITY_CRITICAL, PRIORITY_READ, PRIORITY_BULK
+)
+
+THREADS = 4
+SERVICE_TIME = 0.02
+
+class PooledServer(WSGIServer):
+    """
+    Serves a WSGI app on a fixed pool of threads with accepted connections
+    queueing in front of it, the way gunicorn's gthread worker does.
+    """
+    
+    def __init__(self, app, threads):
+        super().__init__(('127.0.0.1', 0), QuietHandler)
+        self.set_app(app)
+        self.pool = ThreadPoolExecutor(threads)
+    
+    def process_request(self, request, client_address):
+        self.pool.submit(self.handle_in_thread, request, client_address)
+    
+    def handle_in_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+def serve(app_factory, **config):
+    """Serve an app with a route taking SERVICE_TIME on THREADS threads, returning its port"""
+    app = app_factory(WORKER_THREADS=THREADS, CONCURRENCY_TRUST_REQUEST_START=True, **config)
+    app.add_url_rule('/api/work', 'work', lambda: time.sleep(SERVICE_TIME) or 'ok')
+    
+    server = PooledServer(app, THREADS)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return app, server
+
+def drive(server, clients=32, duration=2.0):
+    """
+    Hammer /api/work from many clients, returning the latencies of admitted
+    requests and the rejections. Clients stamp X-Request-Start as a front-end
+    proxy would, since the requests queue before reaching the app.
+    """
+    latencies = []
+    rejected = []
+    deadline = time.perf_counter() + duration
+    
+    def client():
+        while time.perf_counter() < deadline:
+            connection = http.client.HTTPConnection(*server.server_address)
+            start = time.perf_counter()
+            connection.request('GET', '/api/work', headers={'X-Request-Start': f't={time.time():.6f}'})
+            response = connection.getresponse()
+            response.read()
+            elapsed = time.perf_counter() - start
+            connection.close()
+            if response.status == 503:
+                rejected.append(response)
+                time.sleep(0.05)
+            else:
+                latencies.append(elapsed)
+    
+    with ThreadPoolExecutor(clients) as pool:
+        for _ in range(clients):
+            pool.submit(client)
+    server.shutdown()
+    
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return p99, latencies, rejected
+
+def test_admitted_p99_stays_bounded_with_queue_in_front(app_factory):
+    _, server = serve(app_factory, CONCURRENCY_LIMIT_ENABLED=False)
+    unlimited_p99, _, rejected = drive(server)
+    assert not rejected
+    
+    app, server = serve(app_factory, CONCURRENCY_TARGET_LATENCY=SERVICE_TIME * 3, CONCURRENCY_MAX_QUEUE_DELAY=SERVICE_TIME * 3)
+    limited_p99, latencies, rejected = drive(server)
+    
+    assert latencies
+    assert rejected
+    assert rejected[0].getheader('Retry-After') == '1'
+    # Without a limit requests queue for a thread and p99 grows with the
+    # client count; with it requests that queued too long are shed, so
+    # admitted requests stay near the target latency
+    assert limited_p99 < unlimited_p99 / 2
+    assert app.extensions['concurrency_limiter'].limit <= THREADS
+
+def test_request_start_formats():
+    for value in ['t=1700000000.5', '1700000000500', 't=1700000000500000']:
+        assert request_start({'HTTP_X_REQUEST_START': value}) == 1700000000.5
+    assert request_start({}) is None
+    assert request_start({'HTTP_X_REQUEST_START': 'soon'}) is None
+
+def test_reads_queued_too_long_are_shed_before_writes(app_factory, auth_headers):
+    client = app_factory(CONCURRENCY_TRUST_REQUEST_START=True).test_client()
+    stale = {**auth_headers, 'X-Request-Start': f't={time.time() - 5:.6f}'}
+    
+    response = client.get('/api/tasks', headers=stale)
+    assert response.status_code == 503
+    assert response.get_json()['error'] == 'overloaded'
+    assert client.post('/api/tasks', json={'title': 'Queued'}, headers=stale).status_code == 201
+
+def test_untrusted_request_start_is_ignored(app, client, auth_headers):
+    spoofed = {**auth_headers, 'X-Request-Start': f't={time.time() - 0.4:.6f}'}
+    for _ in range(30):
+        assert client.get('/api/tasks', headers=spoofed).status_code == 200
+    
+    assert app.extensions['concurrency_limiter'].limit == app.config['WORKER_THREADS']
+
+def test_limiter_sheds_lower_priorities_first():
+    limiter = AIMDLimiter(10, 2, 100, target_latency=1.0)
+    
+    assert all(limiter.try_acquire(PRIORITY_BULK) for _ in range(5))
+    assert not limiter.try_acquire(PRIORITY_BULK)
+    assert all(limiter.try_acquire(PRIORITY_READ) for _ in range(3))
+    assert not limiter.try_acquire(PRIORITY_READ)
+    assert all(limiter.try_acquire(PRIORITY_CRITICAL) for _ in range(2))
+    assert not limiter.try_acquire(PRIORITY_CRITICAL)
+
+def test_limiter_adapts_to_latency():
+    limiter = AIMDLimiter(10, 2, 100, target_latency=0.1)
+    
+    for _ in range(20):
+        limiter.try_acquire()
+        limiter.release(0.5)
+    assert limiter.limit == 2
+    
+    for _ in range(8):
+        limiter.try_acquire()
+    for _ in range(8):
+        limiter.release(0.01)
+    assert limiter.limit > 2
+
+def test_request_priority_classes(app):
+    cases = [
+        ('POST', '/api/auth/refresh', PRIORITY_CRITICAL),
+        ('POST', '/api/tasks', PRIORITY_CRITICAL),
+        ('GET', '/api/tasks', PRIORITY_READ),
+        ('POST', '/api/jobs', PRIORITY_BULK),
+        ('POST', '/api/batch', PRIORITY_BULK)
+    ]
+    for method, path, expected in cases:
+        with app.test_request_context(path, method=method):
+            assert request_priority() == expected, path
+
+def test_batch_sub_requests_share_the_batch_slot(app, client, auth_headers):
+    response = client.post('/api/batch', headers=auth_headers, json={
+        'requests': [{'method': 'GET', 'path': '/api/tasks'}] * 3
+    })
+    
+    assert response.status_code == 200
+    assert app.extensions['concurrency_limiter'].inflight == 0
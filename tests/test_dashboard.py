@@ -0,0 +1,92 @@
+import time
+from datetime import datetime, timedelta
+
+from backend import job_queue
+from backend.routes.dashboard import summary_cache
+from backend.utils.cache import UserCache
+
+def test_dashboard_summary(client, auth_headers):
+    project = client.post('/api/projects', json={'name': 'Work'}, headers=auth_headers).get_json()['data']
+    yesterday = (datetime.utcnow() - timedelta(days=1)).isoformat()
+    next_year = (datetime.utcnow() + timedelta(days=365)).isoformat()
+    
+    for task in [
+        {'title': 'Overdue', 'due_date': yesterday, 'priority': 'high', 'project_id': project['id']},
+        {'title': 'Later', 'due_date': next_year, 'priority': 'low', 'project_id': project['id']},
+        {'title': 'Done', 'due_date': yesterday, 'status': 'completed'},
+        {'title': 'Whenever', 'status': 'in-progress'}
+    ]:
+        client.post('/api/tasks', json=task, headers=auth_headers)
+    
+    response = client.get('/api/dashboard?limit=2', headers=auth_headers)
+    assert response.status_code == 200
+    summary = response.get_json()['data']
+    
+    assert summary['status_counts'] == {'todo': 2, 'in_progress': 1, 'completed': 1, 'total': 4}
+    assert summary['priority_counts'] == {'high': 1, 'medium': 2, 'low': 1}
+    assert summary['overdue'] == 1
+    assert summary['projects'] == [{
+        'project_id': project['id'],
+        'name': 'Work',
+        'total': 2,
+        'todo': 2,
+        'in_progress': 0,
+        'completed': 0,
+        'overdue': 1,
+        'due_this_week': 0
+    }]
+    assert [task['title'] for task in summary['urgent_tasks']] == ['Overdue', 'Later']
+
+def test_dashboard_cache_invalidated_on_write(app_factory, auth_headers):
+    client = app_factory(DASHBOARD_CACHE_TTL=60).test_client()
+    
+    try:
+        assert client.get('/api/dashboard', headers=auth_headers).get_json()['data']['status_counts']['total'] == 0
+        client.post('/api/tasks', json={'title': 'New'}, headers=auth_headers)
+        assert client.get('/api/dashboard', headers=auth_headers).get_json()['data']['status_counts']['total'] == 1
+    finally:
+        summary_cache.clear()
+
+def test_dashboard_cache_sees_bulk_writes_from_job_workers(app_factory, auth_headers):
+    app = app_factory(DASHBOARD_CACHE_TTL=60)
+    client = app.test_client()
+    
+    try:
+        client.post('/api/tasks', json={'title': 'Done', 'status': 'completed'}, headers=auth_headers)
+        assert client.get('/api/dashboard', headers=auth_headers).get_json()['data']['status_counts']['total'] == 1
+        
+        client.post('/api/jobs', json={'type': 'delete_tasks', 'params': {'status': 'completed'}}, headers=auth_headers)
+        # Run the job the way a worker process would, without the runner that dispatched it
+        with app.app_context():
+            [(job_id, _, attempt)] = job_queue.claim_jobs(10, 10)
+            assert job_queue.run_job(job_id, attempt) == 'completed'
+        
+        assert client.get('/api/dashboard', headers=auth_headers).get_json()['data']['status_counts']['total'] == 0
+    finally:
+        summary_cache.clear()
+
+def test_user_cache_misses_on_a_new_version():
+    cache = UserCache()
+    cache.set(1, 'summary', 1, 'cached', ttl=60)
+    assert cache.get(1, 'summary', 1) == 'cached'
+    assert cache.get(1, 'summary', 2) is None
+
+def test_user_cache_drops_expired_and_outdated_entries():
+    cache = UserCache()
+    cache.set(1, 'outdated', 1, 'value', ttl=60)
+    cache.set(1, 'expiring', 2, 'value', ttl=0.001)
+    time.sleep(0.01)
+    cache.set(1, 'current', 2, 'value', ttl=60)
+    assert list(cache._entries[1]) == ['current']
+
+def test_user_cache_keeps_most_recently_used_users():
+    cache = UserCache(max_users=2)
+    for user_id in (1, 2):
+        cache.set(user_id, 'summary', 1, user_id, ttl=60)
+    cache.get(1, 'summary', 1)
+    cache.set(3, 'summary', 1, 3, ttl=60)
+    assert list(cache._entries) == [1, 3]
+
+def test_dashboard_rejects_invalid_limit(client, auth_headers):
+    assert client.get('/api/dashboard?limit=lots', headers=auth_headers).status_code == 400
+    assert client.get('/api/dashboard?limit=500', headers=auth_headers).status_code == 400
@@ -0,0 +1,196 @@
+import os
+import signal
+import time
+
+from backend import job_queue
+from backend.models.user import db
+from backend.models.job import Job
+
+def create_tasks(client, auth_headers, count, **fields):
+    for index in range(count):
+        client.post('/api/tasks', json={'title': f'Task {index}', **fields}, headers=auth_headers)
+
+def run_due_jobs(app):
+    with app.app_context():
+        return [job_queue.run_job(job_id) for job_id, _, _ in job_queue.claim_jobs(10, 10)]
+
+def test_delete_and_export_jobs(app, client, auth_headers):
+    project = client.post('/api/projects', json={'name': 'Work'}, headers=auth_headers).get_json()['data']
+    create_tasks(client, auth_headers, 3, status='completed', project_id=project['id'])
+    create_tasks(client, auth_headers, 2)
+    
+    response = client.post('/api/jobs', json={'type': 'delete_tasks', 'params': {'status': 'completed'}},
+                           headers=auth_headers)
+    assert response.status_code == 202
+    job = response.get_json()['data']
+    assert job['status'] == 'queued'
+    
+    assert run_due_jobs(app) == ['completed']
+    job = client.get(f"/api/jobs/{job['id']}", headers=auth_headers).get_json()['data']
+    assert job['progress'] == 100
+    assert job['result'] == {'deleted': 3}
+    
+    job = client.post('/api/jobs', json={'type': 'export_tasks', 'params': {'status': 'todo'}},
+                      headers=auth_headers).get_json()['data']
+    run_due_jobs(app)
+    result = client.get(f"/api/jobs/{job['id']}", headers=auth_headers).get_json()['data']['result']
+    assert result['count'] == 2
+    assert result['tasks'] == client.get('/api/tasks?status=todo', headers=auth_headers).get_json()['data']
+
+def test_delete_project_job_detaches_tasks(app, client, auth_headers):
+    project = client.post('/api/projects', json={'name': 'Work'}, headers=auth_headers).get_json()['data']
+    create_tasks(client, auth_headers, 3, project_id=project['id'])
+    
+    job = client.post('/api/jobs', json={'type': 'delete_project', 'params': {'project_id': project['id']}},
+                      headers=auth_headers).get_json()['data']
+    run_due_jobs(app)
+    
+    job = client.get(f"/api/jobs/{job['id']}", headers=auth_headers).get_json()['data']
+    assert job['result'] == {'project_id': project['id'], 'tasks_detached': 3}
+    assert client.get(f"/api/projects/{project['id']}", headers=auth_headers).status_code == 404
+    assert [task['project_id'] for task in client.get('/api/tasks', headers=auth_headers).get_json()['data']] == [None] * 3
+
+def test_failed_jobs_retry_with_backoff(app, client, auth_headers, monkeypatch):
+    def broken(job, params, progress):
+        raise RuntimeError("disk full")
+    monkeypatch.setitem(job_queue.JOB_HANDLERS, 'export_tasks', broken)
+    app.config['JOBS_RETRY_BACKOFF'] = 0
+    
+    job = client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers).get_json()['data']
+    
+    assert run_due_jobs(app) == ['queued']
+    assert run_due_jobs(app) == ['queued']
+    assert run_due_jobs(app) == ['failed']
+    job = client.get(f"/api/jobs/{job['id']}", headers=auth_headers).get_json()['data']
+    assert job['attempts'] == 3
+    assert job['error'] == 'disk full'
+
+def test_per_user_limits(app, client, auth_headers):
+    for _ in range(2):
+        client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers)
+    
+    with app.app_context():
+        assert len(job_queue.claim_jobs(10, 1)) == 1
+        assert job_queue.claim_jobs(10, 1) == []
+    
+    app.config['JOBS_MAX_QUEUED_PER_USER'] = 2
+    response = client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers)
+    assert response.status_code == 429
+
+def test_one_users_backlog_does_not_block_others(app, client, auth_headers):
+    for _ in range(10):
+        client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers)
+    other = client.post('/api/auth/register', json={
+        'name': 'Other User',
+        'email': 'other@example.com',
+        'password': 'Password1'
+    }).get_json()['data']
+    other_headers = {'Authorization': f"Bearer {other['access_token']}"}
+    client.post('/api/jobs', json={'type': 'export_tasks'}, headers=other_headers)
+    
+    with app.app_context():
+        [(_, first_user, _)] = job_queue.claim_jobs(1, 1)
+        assert first_user != other['user']['id']
+        # The first user is at their limit, so the next worker goes to the other
+        [(_, second_user, _)] = job_queue.claim_jobs(1, 1)
+        assert second_user == other['user']['id']
+        assert job_queue.claim_jobs(1, 1) == []
+
+def test_job_validation(client, auth_headers):
+    for data in [
+        {'type': 'reboot'},
+        {'type': 'delete_tasks', 'params': {}},
+        {'type': 'delete_tasks', 'params': {'ids': ['1']}},
+        {'type': 'delete_project', 'params': {}},
+        {'type': 'export_tasks', 'params': {'due_date': 'soon'}}
+    ]:
+        assert client.post('/api/jobs', json=data, headers=auth_headers).status_code == 400
+    
+    response = client.post('/api/jobs', json={'type': 'delete_project', 'params': {'project_id': 404}},
+                           headers=auth_headers)
+    assert response.status_code == 404
+    assert client.get('/api/jobs/404', headers=auth_headers).status_code == 404
+
+def test_abandoned_attempts_are_retried_once(app, client, auth_headers):
+    job = client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers).get_json()['data']
+    app.config['JOBS_RETRY_BACKOFF'] = 0
+    
+    with app.app_context():
+        [(job_id, _, first_attempt)] = job_queue.claim_jobs(10, 10)
+        time.sleep(0.01)
+        
+        # Jobs still in flight in this process are never requeued
+        job_queue.requeue_abandoned_jobs(0, [job_id])
+        assert db.session.get(Job, job_id).status == 'running'
+        
+        job_queue.requeue_abandoned_jobs(0)
+        db.session.remove()
+        [(_, _, second_attempt)] = job_queue.claim_jobs(10, 10)
+        
+        # The abandoned attempt can no longer record an outcome
+        assert job_queue.run_job(job_id, first_attempt) is None
+        assert job_queue.run_job(job_id, second_attempt) == 'completed'
+        assert db.session.get(Job, job_id).attempts == 2
+
+def test_superseded_attempt_discards_its_outcome(app, client, auth_headers, monkeypatch):
+    job = client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers).get_json()['data']
+    
+    def reclaimed_midway(job, params, progress):
+        # Another dispatcher requeues and claims the job while this attempt runs
+        db.session.execute(Job.__table__.update().values(attempts=Job.__table__.c.attempts + 1))
+        db.session.commit()
+        progress(1, 2)
+    monkeypatch.setitem(job_queue.JOB_HANDLERS, 'export_tasks', reclaimed_midway)
+    
+    with app.app_context():
+        [(job_id, _, attempt)] = job_queue.claim_jobs(10, 10)
+        assert job_queue.run_job(job_id, attempt) is None
+        assert db.session.get(Job, job_id).progress == 0
+
+def test_run_job_skips_deleted_jobs(app, client, auth_headers):
+    job = client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers).get_json()['data']
+    
+    with app.app_context():
+        db.session.execute(Job.__table__.delete())
+        db.session.commit()
+        assert job_queue.run_job(job['id']) is None
+
+def wait_for_job(client, auth_headers, job, timeout=60):
+    deadline = time.monotonic() + timeout
+    while job['status'] != 'completed' and time.monotonic() < deadline:
+        time.sleep(0.2)
+        job = client.get(f"/api/jobs/{job['id']}", headers=auth_headers).get_json()['data']
+    return job
+
+def test_worker_pool_runs_jobs(app_factory, auth_headers):
+    client = app_factory(JOBS_ENABLED=True, JOBS_WORKERS=1).test_client()
+    create_tasks(client, auth_headers, 2, status='completed')
+    
+    job = client.post('/api/jobs', json={'type': 'delete_tasks', 'params': {'status': 'completed'}},
+                      headers=auth_headers).get_json()['data']
+    
+    job = wait_for_job(client, auth_headers, job)
+    assert job['status'] == 'completed'
+    assert job['result'] == {'deleted': 2}
+
+def test_worker_pool_survives_dead_worker(app_factory, auth_headers):
+    app = app_factory(JOBS_ENABLED=True, JOBS_WORKERS=1, JOBS_RETRY_BACKOFF=0)
+    client = app.test_client()
+    runner = app.extensions['job_runner']
+    
+    job = client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers).get_json()['data']
+    assert wait_for_job(client, auth_headers, job)['status'] == 'completed'
+    
+    for pid in list(runner.executor._processes):
+        os.kill(pid, signal.SIGKILL)
+    time.sleep(0.5)
+    
+    jobs = [
+        client.post('/api/jobs', json={'type': 'export_tasks'}, headers=auth_headers).get_json()['data']
+        for _ in range(2)
+    ]
+    jobs = [wait_for_job(client, auth_headers, job) for job in jobs]
+    assert [job['status'] for job in jobs] == ['completed', 'completed']
+    # The first job was claimed by the broken pool, then retried on its replacement
+    assert [job['attempts'] for job in jobs] == [2, 1]
+    assert runner.running == set()
@@ -0,0 +1,83 @@
+import io
+import json
+import logging
+
+from backend.utils import log
+from backend.utils.log import LogPipeline
+
+def make_logger(pipeline):
+    logger = logging.getLogger('tests.logging')
+    logger.handlers = [pipeline.handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+def test_full_queue_drops_records_without_blocking():
+    stream = io.StringIO()
+    pipeline = LogPipeline(max_size=2, sample_rate=1.0, stream=stream)
+    logger = make_logger(pipeline)
+    
+    # Nothing drains the queue until the listener starts
+    for index in range(5):
+        logger.info("event %d", index)
+    assert pipeline.dropped == 3
+    
+    pipeline.start()
+    pipeline.stop()
+    
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record['message'] for record in records] == [
+        'event 0',
+        'Log queue full, dropped 3 records',
+        'event 1'
+    ]
+    assert records[1]['level'] == 'WARNING'
+
+def test_sampling_only_applies_to_marked_info_records():
+    stream = io.StringIO()
+    pipeline = LogPipeline(max_size=100, sample_rate=0.0, stream=stream)
+    logger = make_logger(pipeline)
+    pipeline.start()
+    
+    logger.info("GET /api/tasks 200", extra={'sample': True})
+    logger.warning("slow request", extra={'sample': True})
+    logger.info("user registered")
+    pipeline.stop()
+    
+    messages = [json.loads(line)['message'] for line in stream.getvalue().splitlines()]
+    assert messages == ['slow request', 'user registered']
+
+def test_requests_are_logged_with_request_id(app_factory):
+    app = app_factory(LOG_SAMPLE_RATE=1.0)
+    pipeline = app.extensions['log_pipeline']
+    stream = io.StringIO()
+    pipeline.output.setStream(stream)
+    
+    response = app.test_client().get('/', headers={'X-Request-ID': 'req-1'})
+    pipeline.stop()
+    
+    assert response.headers['X-Request-ID'] == 'req-1'
+    record = json.loads(stream.getvalue().splitlines()[-1])
+    assert record['request_id'] == 'req-1'
+    assert record['path'] == '/'
+    assert record['status'] == 200
+    assert record['duration_ms'] >= 0
+
+def test_process_hooks_act_on_the_current_pipeline(app_factory):
+    replaced = app_factory().extensions['log_pipeline']
+    pipeline = app_factory().extensions['log_pipeline']
+    assert not replaced.running
+    assert replaced not in log.running_pipelines
+    assert pipeline in log.running_pipelines
+    
+    # What a forked worker runs: a fresh listener for the running pipeline only
+    listener = pipeline.listener
+    log.restart_pipelines_in_child()
+    assert pipeline.listener is not listener
+    assert replaced.listener._thread is None
+    listener.stop()
+    
+    # What runs at exit
+    log.stop_running_pipelines()
+    assert not pipeline.running
+    assert pipeline not in log.running_pipelines
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.models.task import Task
+from backend.models.project import Project
+from backend.utils import success_response
+
+def seed(client, auth_headers):
+    projects = [
+        client.post('/api/projects', json={'name': name, 'description': 'About ' + name}, headers=auth_headers).get_json()['data']
+        for name in ('Work', 'Home', 'Empty')
+    ]
+    due = datetime(2024, 3, 1, 9, 30, 15, 120000)
+    
+    for index in range(12):
+        task = {
+            'title': f'Task {index}',
+            'description': 'Notes with "quotes" and ünicode' if index % 2 else '',
+            'priority': ('high', 'medium', 'low')[index % 3],
+            'status': ('todo', 'in-progress', 'completed')[index % 3]
+        }
+        if index % 4:
+            task['due_date'] = (due + timedelta(days=index)).isoformat()
+        if index % 3:
+            task['project_id'] = projects[index % 2]['id']
+        client.post('/api/tasks', json=task, headers=auth_headers)
+
+def orm_body(app, items, message):
+    with app.test_request_context():
+        return success_response([item.to_dict() for item in items], message)[0].get_data()
+
+@pytest.mark.parametrize('query, criteria', [
+    ('', []),
+    ('?status=todo', [Task.status == 'todo']),
+    ('?priority=medium&search=notes', [
+        Task.priority == 'medium',
+        Task.title.ilike('%notes%') | Task.description.ilike('%notes%')
+    ]),
+    ('?project_id=1', [Task.project_id == 1]),
+    ('?due_date=2024-03-08T00:00:00Z', [Task.due_date <= datetime(2024, 3, 8)])
+])
+def test_task_list_matches_to_dict(app, client, auth_headers, query, criteria):
+    seed(client, auth_headers)
+    
+    response = client.get('/api/tasks' + query, headers=auth_headers)
+    
+    with app.app_context():
+        tasks = Task.query.filter(Task.user_id == 1, *criteria).all()
+        expected = orm_body(app, tasks, "Tasks retrieved successfully")
+    
+    assert tasks
+    assert response.get_data() == expected
+
+def test_project_list_matches_to_dict(app, client, auth_headers):
+    seed(client, auth_headers)
+    
+    body = client.get('/api/projects', headers=auth_headers).get_data()
+    
+    with app.app_context():
+        expected = orm_body(app, Project.query.filter_by(user_id=1).all(), "Projects retrieved successfully")
+    
+    assert body == expected
+    assert [project['task_count'] for project in client.get('/api/projects', headers=auth_headers).get_json()['data']] == [4, 4, 0]
@@ -0,0 +1,29 @@
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from backend.schema import SCHEMA_VERSION, get_schema_version
+
+def test_boot_requires_migrated_schema(app_factory):
+    with pytest.raises(RuntimeError, match='migrate.py'):
+        app_factory(AUTO_MIGRATE=False)
+    
+    app = app_factory(AUTO_MIGRATE=True)
+    with app.app_context():
+        assert get_schema_version() == SCHEMA_VERSION
+    
+    # Once migrated, booting only checks the version
+    app_factory(AUTO_MIGRATE=False)
+
+def test_locked_database_is_not_mistaken_for_unmigrated(app_factory, db_path):
+    app = app_factory(SQLALCHEMY_ENGINE_OPTIONS={'connect_args': {'timeout': 0.1}})
+    
+    lock = sqlite3.connect(db_path)
+    lock.execute('BEGIN EXCLUSIVE')
+    try:
+        with app.app_context(), pytest.raises(OperationalError, match='locked'):
+            get_schema_version()
+    finally:
+        lock.rollback()
+        lock.close()
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import text
+
+from sql_budget import Budget, SEEDED_PROJECTS, SEEDED_TASKS
+from backend.models.user import db
+
+TASK = {'title': 'Budgeted', 'priority': 'high', 'project_id': 1}
+BATCH = {'requests': [
+    {'method': 'GET', 'path': '/api/tasks'},
+    {'method': 'GET', 'path': '/api/projects'},
+    {'method': 'GET', 'path': '/api/tasks/status-counts'}
+]}
+
+# The SQL each API endpoint may run against the seeded database: at most
+# `statements` statements returning at most `rows` rows, and no full table
+# scans. Every endpoint needs a budget. Writes reload the written row for
+# the response after the commit expires it, which costs one statement, and
+# writes to tasks or projects bump the owner's data version, which costs another.
+BUDGETS = [
+    Budget('POST', '/api/auth/register', 3, 1, body={'name': 'New', 'email': 'new@example.com', 'password': 'Password1'}),
+    Budget('POST', '/api/auth/login', 1, 1, body={'email': 'test@example.com', 'password': 'Password1'}),
+    Budget('POST', '/api/auth/refresh', 0, token='refresh'),
+    Budget('GET', '/api/auth/profile', 1, 1),
+    Budget('PUT', '/api/auth/profile', 3, 2, body={'name': 'Renamed'}),
+    Budget('GET', '/api/tasks', 1, SEEDED_TASKS),
+    Budget('GET', '/api/tasks?status=todo&priority=high', 1, SEEDED_TASKS),
+    Budget('GET', '/api/tasks/1', 1, 1),
+    Budget('POST', '/api/tasks', 4, 2, body=TASK),
+    Budget('PUT', '/api/tasks/1', 5, 3, body=TASK),
+    Budget('DELETE', '/api/tasks/1', 3, 1),
+    Budget('GET', '/api/tasks/status-counts', 1, 3),
+    Budget('GET', '/api/projects', 1, SEEDED_PROJECTS),
+    Budget('GET', '/api/projects/1', 1, 1),
+    Budget('POST', '/api/projects', 4, 2, body={'name': 'Budgeted'}),
+    Budget('PUT', '/api/projects/1', 5, 3, body={'name': 'Renamed'}),
+    Budget('DELETE', '/api/projects/1', 4, 1),
+    # The user's data version, one row per project plus tasks without one,
+    # and the 5 most urgent tasks
+    Budget('GET', '/api/dashboard', 3, 1 + SEEDED_PROJECTS + 1 + 5),
+    Budget('POST', '/api/batch', 3, SEEDED_TASKS + SEEDED_PROJECTS + 3, body=BATCH),
+    Budget('POST', '/api/jobs', 4, 3, body={'type': 'delete_project', 'params': {'project_id': 1}}),
+    Budget('GET', '/api/jobs/1', 1, 1)
+]
+
+def request_with_budget(client, tokens, budget):
+    headers = {'Authorization': f"Bearer {tokens[budget.token + '_token']}"}
+    return client.open(budget.path, method=budget.method, json=budget.body, headers=headers)
+
+@pytest.mark.parametrize('budget', BUDGETS, ids=lambda budget: f'{budget.method} {budget.path}')
+def test_endpoint_within_sql_budget(app, client, seeded_tokens, sql_recorder, budget):
+    with sql_recorder.record() as recording:
+        response = request_with_budget(client, seeded_tokens, budget)
+    
+    assert response.status_code < 400, response.get_json()
+    recording.check(budget, db.metadata.tables)
+
+def test_every_endpoint_has_a_budget(app):
+    adapter = app.url_map.bind('localhost')
+    budgeted = {adapter.match(budget.path.split('?')[0], method=budget.method)[0] for budget in BUDGETS}
+    endpoints = {rule.endpoint for rule in app.url_map.iter_rules() if rule.rule.startswith('/api/')}
+    
+    assert endpoints - budgeted == set()
+
+def test_full_table_scan_is_reported(app, seeded_tokens, sql_recorder):
+    with app.app_context(), sql_recorder.record() as recording:
+        db.session.execute(text('SELECT id FROM tasks WHERE title = :title'), {'title': 'Task 1'}).all()
+    
+    assert recording.rows == 2
+    assert recording.full_scans(db.metadata.tables) == [('tasks', 'SELECT id FROM tasks WHERE title = ?')]
+    with pytest.raises(AssertionError, match='scans whole tables'):
+        recording.check(Budget('GET', '/api/tasks', 1, 2), db.metadata.tables)